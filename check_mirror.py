@@ -0,0 +1,164 @@
+# check_mirror.py
+# gui.TextProxy'nin yayınladığı düzenlemelerle güncellenen belge aynasını
+# gerçek bir Tk Text widget'ıyla karşılaştırır. Her adımdan sonra
+# document.text() ile text.get("1.0", "end") aynı olmalı; renk aralıkları
+# token'ların metnini, imleç konumu belgedeki konumu göstermelidir.
+# Ekran gerekir (ör. xvfb-run python check_mirror.py).
+import argparse
+import random
+import sys
+import tkinter as tk
+
+from gui import SyntaxHighlighter
+
+ALPHABET = ["a", "b", "x", " ", "\n", ";", "{", "}", "ş", "😀", "int ", "/*", "*/", "\"", "𝔸"]
+
+
+def scripted_steps(text):
+    call = lambda *args: text.tk.call(text._w, *args)
+    return [
+        ("delete 2.0 end", lambda: text.delete("2.0", "end")),
+        ("insert end", lambda: text.insert("end", "\nx\ny\n")),
+        ("delete end-1c", lambda: text.delete("end-1c")),
+        ("delete 1.0 end", lambda: text.delete("1.0", "end")),
+        ("insert 1.0", lambda: text.insert("1.0", "int a;\nint b;\nint c;")),
+        ("replace 2.0 end", lambda: text.replace("2.0", "end", "X")),
+        ("replace 1.1 1.3", lambda: text.replace("1.1", "1.3", "yz")),
+        ("insert 99.0", lambda: text.insert("99.0", "son")),
+        ("delete çoklu", lambda: call("delete", "1.0", "1.2", "1.1", "1.4", "2.0", "end")),
+        ("delete end end", lambda: text.delete("end", "end")),
+        ("replace end end", lambda: text.replace("end", "end", "!")),
+        ("delete 1.0 99.0", lambda: text.delete("1.0", "99.0")),
+        # Tk 8.6 BMP dışı karakteri iki sütun sayar
+        ("insert emoji", lambda: text.insert("1.0", "a😀b😀c\nş😀\n")),
+        ("insert emoji sonrası", lambda: text.insert("1.3", "X")),
+        ("delete emoji", lambda: text.delete("1.1", "1.3")),
+        ("replace emoji aralığı", lambda: text.replace("1.2", "1.end", "𝔸y")),
+        ("insert etiketli", lambda: call("insert", "2.3", "p", "", "q", "sel")),
+        ("delete satır sonu", lambda: text.delete("2.end")),
+    ]
+
+
+def editing_steps(text):
+    # Geri al/yinele, kes/yapıştır Tk'nin kendi betikleriyle widget komutundan geçer
+    def select(first, last):
+        text.tag_remove("sel", "1.0", "end")
+        text.tag_add("sel", first, last)
+
+    return [
+        ("undo", lambda: text.edit_undo()),
+        ("undo", lambda: text.event_generate("<<Undo>>")),
+        ("redo", lambda: text.edit_redo()),
+        ("kes", lambda: (select("1.0", "2.1"), text.tk.call("tk_textCut", text._w))),
+        ("yapıştır", lambda: (text.mark_set("insert", "end"), text.tk.call("tk_textPaste", text._w))),
+        ("seçimin üstüne yapıştır", lambda: (select("1.2", "1.3"), text.event_generate("<<Paste>>"))),
+    ]
+
+
+def random_index(rng, text):
+    # Sütunlar "+Nc" ile verilir: Tk 8.6 bir emojinin UTF-16 yarıları arasındaki
+    # sütunu da kabul eder ve oradan silince karakteri bozar; klavye ile o
+    # konuma gelinemez, ayna da yarım karakteri gösteremez
+    lines = int(text.index("end").split(".")[0])
+    return rng.choice([
+        f"{rng.randint(1, lines + 1)}.0+{rng.randint(0, 6)}c",
+        f"{rng.randint(1, lines)}.end",
+        "end", "end-1c", "1.0", "insert",
+        f"end-{rng.randint(1, 4)}c",
+    ])
+
+
+def random_text(rng):
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 4)))
+
+
+def random_step(rng, text):
+    kind = rng.choice(["insert", "delete", "delete", "replace", "undo"])
+    if kind == "insert":
+        index, chars = random_index(rng, text), random_text(rng)
+        return f"insert {index} {chars!r}", lambda: text.insert(index, chars)
+    if kind == "delete":
+        indices = [random_index(rng, text) for _ in range(rng.choice([1, 2, 2, 4, 6]))]
+        return f"delete {indices}", lambda: text.tk.call(text._w, "delete", *indices)
+    if kind == "replace":
+        first, last, chars = random_index(rng, text), random_index(rng, text), random_text(rng)
+        return f"replace {first} {last} {chars!r}", lambda: text.tk.call(text._w, "replace", first, last, chars)
+    return "undo", lambda: text.tk.call(text._w, "edit", "undo")
+
+
+def check_views(app):
+    # Renk aralıkları ve imleç konumu Tk sütunlarıyla belge konumları arasında
+    # doğru çevrilmeli
+    failures = []
+    app.highlight()
+    code = app.document.text()
+    for token in app.occurrences.tokens[:-1]:
+        shown = app.text.get(*app.token_range(token))
+        if shown != code[token.start_pos:token.end_pos]:
+            failures.append(f"token {token.value!r} satır {token.line}: widget aralığı {shown!r}")
+            break
+    expected = len(app.text.get("1.0", "insert"))
+    if app.cursor_offset() != expected:
+        failures.append(f"imleç {app.text.index('insert')}: {app.cursor_offset()} != {expected}")
+    return failures
+
+
+def check_errors(app):
+    # Tk hataları (ör. seçim yokken sel.first) çağırana ulaşmalı; Tk'nin
+    # tk_textCopy betiği seçim yokken panoyu değiştirmemeli
+    failures = []
+    text = app.text
+    text.tag_remove("sel", "1.0", "end")
+    for label, call in [("index sel.first", lambda: text.index("sel.first")),
+                        ("insert bogus", lambda: text.insert("bogus", "x")),
+                        ("get sel.first sel.last", lambda: text.get("sel.first", "sel.last"))]:
+        try:
+            result = call()
+        except tk.TclError:
+            continue
+        failures.append(f"{label}: hata yerine {result!r} döndü")
+    text.clipboard_clear()
+    text.clipboard_append("pano")
+    text.tk.call("tk_textCopy", text._w)
+    text.tk.call("tk_textCut", text._w)
+    if text.clipboard_get() != "pano":
+        failures.append(f"seçim yokken kopyala/kes panoyu değiştirdi: {text.clipboard_get()!r}")
+    return failures
+
+
+def check_mirror(root, steps=300, seed=0):
+    """Uyuşmayan adımların listesini döndürür."""
+    app = SyntaxHighlighter(root, code="a\nb\nc")
+    text = app.text
+    text.configure(undo=True, autoseparators=True)
+    rng = random.Random(seed)
+    failures = check_errors(app)
+    plan = scripted_steps(text) + editing_steps(text)
+    # Rastgele adımlar o anki metnin satır sayısına göre sırası gelince üretilir
+    for number in range(len(plan) + steps):
+        label, step = plan[number] if number < len(plan) else random_step(rng, text)
+        try:
+            step()
+        except tk.TclError:
+            pass  # Ör. geri alınacak düzenleme yok; ayna yine de aynı kalmalı
+        text.edit_separator()
+        widget, mirror = text.get("1.0", "end"), app.document.text()
+        if widget != mirror:
+            failures.append(f"{label}: widget={widget!r} ayna={mirror!r}")
+            break
+        if number % 25 == 0 or number == len(plan) - 1:
+            text.mark_set("insert", random_index(rng, text))
+            failures.extend(f"{label}: {failure}" for failure in check_views(app))
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Belge aynasını gerçek Tk Text widget'ıyla karşılaştırır.")
+    parser.add_argument("-n", "--steps", type=int, default=300, help="rastgele düzenleme sayısı")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    root = tk.Tk()
+    failures = check_mirror(root, args.steps, args.seed)
+    root.destroy()
+    print("\n".join(failures) or "ayna widget ile aynı")
+    sys.exit(1 if failures else 0)
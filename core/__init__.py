@@ -0,0 +1,6 @@
+# core/__init__.py
+# Tkinter'a bağımlı olmayan çekirdek: lexer, parser ve tema verisi. CLI ve
+# sunucu süreçleri yalnızca bu paketi yükler; GUI ayrı modüldedir (gui.py).
+from .lexer import Lexer, Token, TokenType, tokenize
+from .parser import Parser, ParseError, Program, ResumableParse
+from .theme import ModernTheme
@@ -0,0 +1,312 @@
+# core/document.py
+# Metin tamponunun parça tablosu (piece table) modeli. Metin, değişmeyen
+# özgün tampon ile yalnızca sona eklenen ekleme tamponuna işaret eden
+# parçalardan oluşur. Parçalar uzunluk ve satır sonu sayısıyla zenginleştirilmiş
+# kalıcı bir treap'te tutulur: düzenleme, konum <-> satır/sütun dönüşümü
+# O(log n)'dir ve anlık görüntü yalnızca kök referansıdır.
+import random
+import sys
+from array import array
+from bisect import bisect_left
+from dataclasses import replace
+
+from .edits import EditDelta
+
+_ORIGINAL, _ADD = 0, 1
+# Ekleme tamponu kod noktası başına tam bir 4 baytlık birimdir. array('u')
+# 3.13 öncesi Windows'ta UTF-16 olduğu için BMP dışı karakterlerde (ör. emoji)
+# konumları kaydırırdı.
+_UNIT = "I"
+_ENCODING = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+# Bu kadar eski düzenleme kaydı tutulur; daha eski sürümlerden taşıma None döner
+LOG_LIMIT = 4096
+
+
+class _Piece:
+    # Değişmez treap düğümü; size/lines alt ağacın toplamlarıdır
+    __slots__ = ("buffer", "start", "length", "newlines", "priority", "left", "right", "size", "lines")
+
+    def __init__(self, buffer, start, length, newlines, priority, left, right):
+        self.buffer = buffer
+        self.start = start
+        self.length = length
+        self.newlines = newlines
+        self.priority = priority
+        self.left = left
+        self.right = right
+        self.size = length + (left.size if left else 0) + (right.size if right else 0)
+        self.lines = newlines + (left.lines if left else 0) + (right.lines if right else 0)
+
+    def with_children(self, left, right):
+        return _Piece(self.buffer, self.start, self.length, self.newlines, self.priority, left, right)
+
+
+def _size(node):
+    return node.size if node else 0
+
+
+def _lines(node):
+    return node.lines if node else 0
+
+
+def _merge(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        return left.with_children(left.left, _merge(left.right, right))
+    return right.with_children(_merge(left, right.left), right.right)
+
+
+def _pieces(node):
+    # Parçalar metin sırasıyla (özyinelemesiz gezinme)
+    stack = []
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+class _Reader:
+    """Document ve Snapshot'ın ortak okuma işlemleri."""
+
+    def __init__(self, root, buffers, newlines, version):
+        self._root = root
+        self._buffers = buffers      # (özgün str, ekleme array'i)
+        self._newlines = newlines    # Tampon başına artan sıralı '\n' konumları
+        self.version = version
+
+    def __len__(self):
+        return _size(self._root)
+
+    @property
+    def line_count(self):
+        return _lines(self._root) + 1
+
+    def _chunk(self, buffer, start, end):
+        if buffer == _ORIGINAL:
+            return self._buffers[_ORIGINAL][start:end]
+        return self._buffers[_ADD][start:end].tobytes().decode(_ENCODING, "surrogatepass")
+
+    def text(self):
+        return "".join(self._chunk(piece.buffer, piece.start, piece.start + piece.length)
+                       for piece in _pieces(self._root))
+
+    def slice(self, start, end):
+        """[start, end) aralığının metni; yalnızca kesişen parçalar okunur."""
+        chunks = []
+        self._collect(self._root, max(start, 0), min(end, len(self)), 0, chunks)
+        return "".join(chunks)
+
+    def _collect(self, node, start, end, base, chunks):
+        if node is None or start >= end:
+            return
+        left_size = _size(node.left)
+        if start < base + left_size:
+            self._collect(node.left, start, end, base, chunks)
+        piece_start = base + left_size
+        piece_end = piece_start + node.length
+        if start < piece_end and end > piece_start:
+            first = max(start, piece_start) - piece_start + node.start
+            last = min(end, piece_end) - piece_start + node.start
+            chunks.append(self._chunk(node.buffer, first, last))
+        if end > piece_end:
+            self._collect(node.right, start, end, piece_end, chunks)
+
+    def _newlines_before(self, offset):
+        node, count = self._root, 0
+        while node is not None:
+            left_size = _size(node.left)
+            if offset <= left_size:
+                node = node.left
+                continue
+            offset -= left_size
+            count += _lines(node.left)
+            if offset <= node.length:
+                positions = self._newlines[node.buffer]
+                return count + bisect_left(positions, node.start + offset) - bisect_left(positions, node.start)
+            offset -= node.length
+            count += node.newlines
+            node = node.right
+        return count
+
+    def line_start(self, line):
+        """1 tabanlı `line` satırının ilk karakterinin konumu."""
+        if not 1 <= line <= self.line_count:
+            raise IndexError(f"Satır {line} belgede yok (satır sayısı {self.line_count})")
+        wanted, node, base = line - 1, self._root, 0
+        if wanted == 0:
+            return 0
+        while node is not None:
+            left_lines = _lines(node.left)
+            if wanted <= left_lines:
+                node = node.left
+                continue
+            wanted -= left_lines
+            base += _size(node.left)
+            if wanted <= node.newlines:
+                positions = self._newlines[node.buffer]
+                newline = positions[bisect_left(positions, node.start) + wanted - 1]
+                return base + newline - node.start + 1
+            wanted -= node.newlines
+            base += node.length
+            node = node.right
+        raise AssertionError("satır sonu sayıları tutarsız")
+
+    def position(self, offset):
+        """Konumu Token ile aynı biçimde (satır, sütun) olarak döndürür; ikisi de 1 tabanlı."""
+        if not 0 <= offset <= len(self):
+            raise IndexError(f"Konum {offset} belgenin dışında (uzunluk {len(self)})")
+        line = self._newlines_before(offset) + 1
+        return line, offset - self.line_start(line) + 1
+
+    def offset(self, line, column):
+        return self.line_start(line) + column - 1
+
+    def index(self, offset):
+        """Tk Text indeksi ("satır.sütun", sütun 0 tabanlı)."""
+        line, column = self.position(offset)
+        return f"{line}.{column - 1}"
+
+
+class Snapshot(_Reader):
+    """Belgenin belirli bir sürümünün değişmez görünümü. Tamponlar yalnızca
+    sona eklendiği için başka iş parçacıklarından güvenle okunabilir."""
+
+
+class Document(_Reader):
+    """Text widget'ını yansıtan düzenlenebilir belge."""
+
+    def __init__(self, text=""):
+        newlines = ([index for index, char in enumerate(text) if char == "\n"], [])
+        root = _Piece(_ORIGINAL, 0, len(text), len(newlines[0]), random.random(), None, None) if text else None
+        super().__init__(root, (text, array(_UNIT)), newlines, 0)
+        self._log = []  # Sürüm sürüm (konum, silinen, eklenen_uzunluk)
+        self._log_base = 0  # _log[0]'ın ait olduğu sürüm
+
+    def snapshot(self):
+        return Snapshot(self._root, self._buffers, self._newlines, self.version)
+
+    def _leaf(self, buffer, start, length):
+        positions = self._newlines[buffer]
+        newlines = bisect_left(positions, start + length) - bisect_left(positions, start)
+        return _Piece(buffer, start, length, newlines, random.random(), None, None)
+
+    def _split(self, node, offset):
+        # (ilk `offset` karakter, kalan) ağaçları; gerekiyorsa bir parça ikiye bölünür
+        if node is None:
+            return None, None
+        left_size = _size(node.left)
+        if offset <= left_size:
+            first, second = self._split(node.left, offset)
+            return first, node.with_children(second, node.right)
+        offset -= left_size
+        if offset >= node.length:
+            first, second = self._split(node.right, offset - node.length)
+            return node.with_children(node.left, first), second
+        head = self._leaf(node.buffer, node.start, offset)
+        tail = self._leaf(node.buffer, node.start + offset, node.length - offset)
+        return _merge(node.left, head), _merge(tail, node.right)
+
+    def _extend_last(self, node, extra):
+        # Art arda yazılan karakterler son parçayı uzatır, yeni parça açılmaz
+        if node.right is not None:
+            return node.with_children(node.left, self._extend_last(node.right, extra))
+        grown = self._leaf(node.buffer, node.start, node.length + extra)
+        return _Piece(grown.buffer, grown.start, grown.length, grown.newlines, node.priority, node.left, None)
+
+    def insert(self, offset, text):
+        self.apply(EditDelta(offset, 0, text))
+
+    def delete(self, offset, count):
+        self.apply(EditDelta(offset, count, ""))
+
+    def apply(self, edit):
+        offset, removed, inserted = edit
+        if not (0 <= offset <= len(self) and 0 <= removed <= len(self) - offset):
+            raise ValueError(f"Geçersiz düzenleme {edit!r} (belge uzunluğu {len(self)})")
+        before, rest = self._split(self._root, offset)
+        after = self._split(rest, removed)[1] if removed else rest
+        if inserted:
+            add = self._buffers[_ADD]
+            start = len(add)
+            add.frombytes(inserted.encode(_ENCODING, "surrogatepass"))
+            self._newlines[_ADD].extend(start + index for index, char in enumerate(inserted) if char == "\n")
+            last = before
+            while last is not None and last.right is not None:
+                last = last.right
+            if last is not None and last.buffer == _ADD and last.start + last.length == start:
+                before = self._extend_last(before, len(inserted))
+            else:
+                before = _merge(before, self._leaf(_ADD, start, len(inserted)))
+        self._root = _merge(before, after)
+        self._log.append((offset, removed, len(inserted)))
+        self.version += 1
+        if len(self._log) > LOG_LIMIT:
+            self.trim_log(self.version - LOG_LIMIT // 2)
+
+    # --- Eski sürümlerdeki konumları güncel belgeye taşıma ---
+
+    def trim_log(self, version):
+        """`version`'dan eski düzenleme kayıtlarını bırakır; o sürümlerden
+        taşıma artık istenmeyecekse (ör. analiz güncel sürüme yetiştiyse)
+        çağrılır. Kayıt en fazla LOG_LIMIT düzenleme tutar."""
+        drop = min(version, self.version) - self._log_base
+        if drop > 0:
+            del self._log[:drop]
+            self._log_base += drop
+
+    def map_span(self, start, end, since):
+        """`since` sürümündeki [start, end) aralığını güncel sürüme taşır.
+        Bir düzenleme aralığa değdiyse (içinde ya da bitişiğinde) ya da o
+        sürümün kaydı bırakıldıysa None döner; bitişik değişiklik de token'ı
+        uzatabileceği için hasar sayılır."""
+        if since < self._log_base:
+            return None
+        for offset, removed, inserted in self._log[since - self._log_base:]:
+            if offset > end:
+                continue
+            if offset + removed < start:
+                shift = inserted - removed
+                start, end = start + shift, end + shift
+                continue
+            return None
+        return start, end
+
+    def relocate(self, token, since):
+        """`since` sürümünden kalan token'ın güncel konumlu kopyası, ya da
+        düzenlemeden etkilendiyse None."""
+        span = self.map_span(token.start_pos, token.end_pos, since)
+        if span is None:
+            return None
+        if span[0] == token.start_pos:
+            return token
+        line, column = self.position(span[0])
+        return replace(token, start_pos=span[0], end_pos=span[1], line=line, column=column)
+
+
+if __name__ == "__main__":
+    import time
+
+    line = "int deger = hesapla(1, 2); // açıklama\n"
+    document = Document(line * 50000)
+    started = time.perf_counter()
+    for step in range(5000):
+        document.insert((step * 7919) % len(document), "x")
+    elapsed = time.perf_counter() - started
+    print(f"{len(document)} karakter, {document.line_count} satır; "
+          f"5000 dağınık ekleme {elapsed * 1000:.0f} ms")
+    text = line * 50000
+    started = time.perf_counter()
+    for step in range(5000):
+        offset = (step * 7919) % len(text)
+        text = text[:offset] + "x" + text[offset:]
+    print(f"aynı eklemeler str üzerinde {(time.perf_counter() - started) * 1000:.0f} ms")
+    started = time.perf_counter()
+    for offset in range(0, len(document), len(document) // 1000):
+        document.offset(*document.position(offset))
+    print(f"1000 konum <-> satır/sütun dönüşümü {(time.perf_counter() - started) * 1000:.1f} ms")
@@ -0,0 +1,42 @@
+# core/edits.py
+# Metin düzenlemelerinin ortak gösterimi: GUI'nin yayınladığı değişiklikler,
+# servisin kabul ettiği düzenlemeler ve belge modeli aynı üçlüyü kullanır.
+from typing import NamedTuple
+
+
+class EditDelta(NamedTuple):
+    offset: int     # Düzenlemenin başladığı karakter konumu
+    removed: int    # Silinen karakter sayısı
+    inserted: str   # Eklenen metin
+
+
+def apply_edit(text, edit):
+    offset, removed, inserted = edit
+    if not (0 <= offset <= len(text) and 0 <= removed <= len(text) - offset):
+        raise ValueError(f"Geçersiz düzenleme {edit!r} (metin uzunluğu {len(text)})")
+    return text[:offset] + inserted + text[offset + removed:]
+
+
+def changed_range(edits):
+    """Sırayla uygulanan düzenlemelerin toplam etkisini (başlangıç, eski_bitiş,
+    yeni_bitiş) olarak döndürür: metin bu aralığın dışında değişmemiş, aralığın
+    sonrası yeni_bitiş - eski_bitiş kadar kaymıştır. Düzenleme yoksa None."""
+    window = None
+    shift = 0
+    for offset, removed, inserted in edits:
+        if not removed and not inserted:
+            continue
+        end = offset + len(inserted)
+        if window is None:
+            start, stop = offset, end
+        else:
+            start, stop = window
+            # Aralığın sonu düzenlemeden sonraysa kayar; değilse düzenlemenin sonuna taşınır
+            stop = stop + len(inserted) - removed if stop >= offset + removed else end
+            start = min(start, offset)
+        window = start, stop
+        shift += len(inserted) - removed
+    if window is None:
+        return None
+    start, stop = window
+    return start, stop - shift, stop
@@ -0,0 +1,863 @@
+# core/executor.py
+# Program AST'lerini çalıştırma. compile_program AST'yi bir kez iç içe Python
+# closure'larına derler: değişkenler derleme anında çerçeve yuvalarına
+# çözülür, sabit ifadeler katlanır ve operatör fonksiyonları önceden seçilir.
+# Interpreter ise aynı anlamı AST üzerinde dolaşarak uygulayan basit
+# ziyaretçidir; karşılaştırma ve kıyaslama için tutulur.
+import operator
+import re
+import sys
+
+from .lexer import TokenType
+from .parser import (
+    ArrayAccess, Assignment, Binary, Block, Call, Declaration, ErrorNode, ExpressionStatement,
+    ForStatement, FunctionDeclaration, IfStatement, Literal, PrintStatement,
+    PropertyAccess, ReturnStatement, Unary, Variable, WhileStatement,
+)
+
+
+class ExecutionError(Exception):
+    def __init__(self, message, token=None):
+        self.message = message
+        self.token = token
+        if token:
+            super().__init__(f"Satır {token.line}, Sütun {token.column}: {message} (Token: {token.value})")
+        else:
+            super().__init__(message)
+
+
+# --- Ortak anlam: iki yürütücü de aynı yardımcıları kullanır ---
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "0": "\0"}
+_ESCAPE = re.compile(r"\\(.)", re.S)
+
+
+def literal_value(token):
+    if token.type == TokenType.NUMBER:
+        return float(token.value) if "." in token.value else int(token.value)
+    if token.type == TokenType.STRING_LITERAL:
+        return _ESCAPE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), token.value[1:-1])
+    return {TokenType.TRUE: True, TokenType.FALSE: False}.get(token.type)
+
+
+def format_value(value):
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is list:
+        return "[" + ", ".join(format_value(item) for item in value) + "]"
+    return str(value)
+
+
+def _add(a, b):
+    # Stringle toplama, diğer tarafı metne çevirip birleştirir
+    if type(a) is str or type(b) is str:
+        return format_value(a) + format_value(b)
+    return a + b
+
+
+def _divide(a, b):
+    if b == 0:
+        raise ExecutionError("Sıfıra bölme.")
+    if type(a) is int and type(b) is int:
+        quotient = abs(a) // abs(b)  # C gibi sıfıra doğru kırpılır
+        return quotient if (a < 0) == (b < 0) else -quotient
+    return a / b
+
+
+BINARY_OPERATORS = {
+    TokenType.PLUS: _add,
+    TokenType.MINUS: operator.sub,
+    TokenType.MULTIPLY: operator.mul,
+    TokenType.DIVIDE: _divide,
+    TokenType.EQUALS: operator.eq,
+    TokenType.NOT_EQUALS: operator.ne,
+    TokenType.LESS_THAN: operator.lt,
+    TokenType.GREATER_THAN: operator.gt,
+    TokenType.LESS_EQUALS: operator.le,
+    TokenType.GREATER_EQUALS: operator.ge,
+}
+
+UNARY_OPERATORS = {
+    TokenType.MINUS: operator.neg,
+    TokenType.NOT: operator.not_,
+}
+
+
+def coerce(type_token, is_array, value):
+    # Bildirilen tipe dönüştürme: int'e atanan float kırpılır, float'a atanan int genişler
+    if is_array:
+        return value
+    if type_token.type == TokenType.INT and type(value) is float:
+        return int(value)
+    if type_token.type == TokenType.FLOAT and type(value) in (int, bool):
+        return float(value)
+    return value
+
+
+def default_value(type_token, is_array):
+    if is_array:
+        return []
+    return {
+        TokenType.INT: 0, TokenType.FLOAT: 0.0,
+        TokenType.STRING_TYPE: "", TokenType.BOOL: False,
+    }.get(type_token.type)
+
+
+def index_value(array, index, token=None):
+    if type(index) is not int or not 0 <= index < len(array):
+        raise ExecutionError(f"Dizi indeksi sınır dışında: {format_value(index)}", token)
+    return array[index]
+
+
+def store_index(array, index, value, token=None):
+    # Dizinin hemen sonuna yazmak diziyi büyütür
+    if type(index) is int and 0 <= index < len(array):
+        array[index] = value
+    elif index == len(array) and type(array) is list:
+        array.append(value)
+    else:
+        raise ExecutionError(f"Dizi indeksi sınır dışında: {format_value(index)}", token)
+
+
+def property_value(value, name):
+    if name.value == "length" and type(value) in (list, str):
+        return len(value)
+    raise ExecutionError(f"Bilinmeyen özellik '{name.value}'.", name)
+
+
+def _node_token(node):
+    # Hata iletileri için düğüme en yakın token
+    while isinstance(node, (ArrayAccess, PropertyAccess, Call)):
+        node = node.name if isinstance(node, ArrayAccess) else (
+            node.object if isinstance(node, PropertyAccess) else node.callee)
+    return node.name if isinstance(node, Variable) else None
+
+
+def _guard(function, *args):
+    # Python çalışma zamanı hatalarını dilin hata tipine çevirir
+    try:
+        return function(*args)
+    except RecursionError:
+        raise ExecutionError("Özyineleme derinliği aşıldı.") from None
+    except TypeError as error:
+        raise ExecutionError(f"Tip hatası: {error}") from None
+    except (OverflowError, ValueError) as error:
+        # Ör. inf/NaN'ın int'e kırpılması ya da float'a sığmayan tamsayı
+        raise ExecutionError(f"Sayısal hata: {error}") from None
+
+
+# --- Closure derleyici ---
+
+class _Function:
+    __slots__ = ("declaration", "size", "body")
+
+    def __init__(self, declaration):
+        self.declaration = declaration
+        self.size = 0
+        self.body = None
+
+
+class _Slot:
+    __slots__ = ("index", "is_global", "type_token", "is_array")
+
+    def __init__(self, index, is_global, type_token, is_array):
+        self.index = index
+        self.is_global = is_global
+        self.type_token = type_token
+        self.is_array = is_array
+
+
+def _effect(function):
+    # Dönüş değeri "return" sinyali sayılmasın diye sarmalanır
+    def run(f):
+        function(f)
+    return run
+
+
+# Sık döngü kalıpları için özel closure'lar: "yerel OP sabit" ve "yerel OP yerel"
+_LOCAL_CONST = {
+    TokenType.LESS_THAN: lambda i, c: lambda f: f[i] < c,
+    TokenType.LESS_EQUALS: lambda i, c: lambda f: f[i] <= c,
+    TokenType.GREATER_THAN: lambda i, c: lambda f: f[i] > c,
+    TokenType.GREATER_EQUALS: lambda i, c: lambda f: f[i] >= c,
+    TokenType.EQUALS: lambda i, c: lambda f: f[i] == c,
+    TokenType.NOT_EQUALS: lambda i, c: lambda f: f[i] != c,
+    TokenType.MINUS: lambda i, c: lambda f: f[i] - c,
+    TokenType.MULTIPLY: lambda i, c: lambda f: f[i] * c,
+}
+_LOCAL_LOCAL = {
+    TokenType.LESS_THAN: lambda i, j: lambda f: f[i] < f[j],
+    TokenType.LESS_EQUALS: lambda i, j: lambda f: f[i] <= f[j],
+    TokenType.GREATER_THAN: lambda i, j: lambda f: f[i] > f[j],
+    TokenType.GREATER_EQUALS: lambda i, j: lambda f: f[i] >= f[j],
+    TokenType.MINUS: lambda i, j: lambda f: f[i] - f[j],
+    TokenType.MULTIPLY: lambda i, j: lambda f: f[i] * f[j],
+}
+
+
+# Bildirimi henüz çalışmamış global yuvanın değeri; ziyaretçi yorumlayıcı
+# gibi okuma ve atama "Tanımsız değişken" hatası verir
+_UNDECLARED = object()
+
+
+def _undeclared(name):
+    raise ExecutionError(f"Tanımsız değişken '{name.value}'.", name)
+
+
+def _redeclared(name):
+    raise ExecutionError(f"Değişken '{name.value}' zaten tanımlı.", name)
+
+
+class CompiledProgram:
+    def __init__(self, main, main_size, globals_, global_slots, functions):
+        self._main = main
+        self._main_size = main_size
+        self._globals = globals_
+        self._global_slots = global_slots
+        self._functions = functions
+
+    def run(self):
+        """Üst düzey deyimleri sırayla çalıştırır. Global değişkenler her
+        çalıştırmada bildirimleri çalışana dek tanımsız sayılır."""
+        for slot in self._global_slots.values():
+            self._globals[slot.index] = _UNDECLARED
+        _guard(self._main, [None] * self._main_size)
+
+    def call(self, name, *args):
+        """Derlenmiş bir fonksiyonu Python değerleriyle çağırır (ör. dizi geçirmek için)."""
+        function = self._functions.get(name)
+        if function is None:
+            raise ExecutionError(f"Tanımsız fonksiyon '{name}'.")
+        declaration = function.declaration
+        if len(args) != len(declaration.parameters):
+            raise ExecutionError(f"'{name}' {len(declaration.parameters)} argüman bekliyor.", declaration.name)
+        frame = [None] * function.size
+        for index, (parameter, value) in enumerate(zip(declaration.parameters, args)):
+            frame[index] = coerce(parameter.type_token, parameter.is_array, value)
+        result = _guard(function.body, frame)
+        return _return_value(declaration, result)
+
+
+def _return_value(declaration, result):
+    if result is None:
+        return None
+    return coerce(declaration.return_type, declaration.is_array_return, result[0])
+
+
+class _Compiler:
+    def __init__(self, program, output):
+        self.program = program
+        self.output = output
+        self.globals = []
+        self.global_slots = {}
+        self.functions = {}
+        self.scopes = []
+        self.size = 0
+
+    def compile(self):
+        # Önce imzalar ve global değişkenler: ileriye dönük çağrı ve erişim mümkün
+        for node in self.program.statements:
+            if isinstance(node, FunctionDeclaration):
+                self.functions[node.name.value] = _Function(node)
+            elif isinstance(node, Declaration) and node.name.value not in self.global_slots:
+                self.global_slots[node.name.value] = _Slot(len(self.globals), True, node.type_token, node.is_array)
+                self.globals.append(_UNDECLARED)
+        for function in self.functions.values():
+            self.compile_function(function)
+
+        self.scopes, self.size = [], 0
+        main = [node for node in self.program.statements if not isinstance(node, FunctionDeclaration)]
+        main_fn = self.block_function(main)
+        return CompiledProgram(main_fn, self.size, self.globals, self.global_slots, self.functions)
+
+    def compile_function(self, function):
+        declaration = function.declaration
+        self.scopes, self.size = [{}], 0
+        for parameter in declaration.parameters:
+            self.declare(parameter.name, parameter.type_token, parameter.is_array)
+        function.body = self.block_function(declaration.body.statements)
+        function.size = self.size
+
+    # --- Kapsamlar ---
+
+    def declare(self, name, type_token, is_array):
+        if not self.scopes:  # Üst düzey bildirim: global yuva
+            return self.global_slots[name.value]
+        slot = _Slot(self.size, False, type_token, is_array)
+        self.size += 1
+        self.scopes[-1][name.value] = slot
+        return slot
+
+    def resolve(self, name):
+        for scope in reversed(self.scopes):
+            if name.value in scope:
+                return scope[name.value]
+        if name.value in self.global_slots:
+            return self.global_slots[name.value]
+        raise ExecutionError(f"Tanımsız değişken '{name.value}'.", name)
+
+    # --- Deyimler: (closure, return_olabilir) ---
+
+    def block_function(self, statements):
+        function, _ = self.sequence([self.statement(node) for node in statements])
+        return function
+
+    def sequence(self, compiled):
+        compiled = [item for item in compiled if item is not None]
+        may_return = any(returns for _, returns in compiled)
+        if not compiled:
+            return (lambda f: None), False
+        if len(compiled) == 1:
+            return compiled[0]
+        if not may_return:
+            functions = [function for function, _ in compiled]
+            if len(functions) == 2:
+                first, second = functions
+
+                def run(f):
+                    first(f)
+                    second(f)
+                return run, False
+
+            def run(f):
+                for function in functions:
+                    function(f)
+            return run, False
+
+        steps = [(function if returns else _effect(function)) for function, returns in compiled]
+
+        def run(f):
+            for step in steps:
+                result = step(f)
+                if result is not None:
+                    return result
+        return run, True
+
+    def statement(self, node):
+        if isinstance(node, FunctionDeclaration):
+            raise ExecutionError("Fonksiyonlar yalnızca üst düzeyde tanımlanabilir.", node.name)
+        if isinstance(node, ErrorNode):
+            raise ExecutionError(f"Hatalı deyim çalıştırılamaz: {node.error.message}", node.error.token)
+        if isinstance(node, Declaration):
+            return self.declaration(node), False
+        if isinstance(node, ExpressionStatement):
+            return self.effect(node.expression), False
+        if isinstance(node, PrintStatement):
+            value, output = self.expression(node.expression), self.output
+            return (lambda f: output(format_value(value(f)))), False
+        if isinstance(node, ReturnStatement):
+            if node.value is None:
+                return (lambda f: (None,)), True
+            value = self.expression(node.value)
+            return (lambda f: (value(f),)), True
+        if isinstance(node, Block):
+            self.scopes.append({})
+            compiled = [self.statement(child) for child in node.statements]
+            self.scopes.pop()
+            return self.sequence(compiled)
+        if isinstance(node, IfStatement):
+            return self.if_statement(node)
+        if isinstance(node, WhileStatement):
+            return self.while_statement(node)
+        if isinstance(node, ForStatement):
+            return self.for_statement(node)
+        raise ExecutionError(f"Çalıştırılamayan düğüm: {type(node).__name__}.")
+
+    def declaration(self, node):
+        value = self.expression(node.initializer) if node.initializer is not None else None
+        slot = self.declare(node.name, node.type_token, node.is_array)
+        index = slot.index
+        frame_store = self.store_function(slot, node.name)
+        if value is None:
+            if node.is_array:
+                return lambda f: frame_store(f, [])
+            default = default_value(node.type_token, node.is_array)
+            return lambda f: frame_store(f, default)
+        value = self.coerced(value, slot)
+        if not slot.is_global:
+            def run(f):
+                f[index] = value(f)
+            return run
+        return lambda f: frame_store(f, value(f))
+
+    def store_function(self, slot, name):
+        index = slot.index
+        if slot.is_global:
+            # Global yuva ilk bildirimin tipini taşır; aynı ismin yeniden
+            # bildirimi ziyaretçi yorumlayıcıdaki gibi reddedilir
+            globals_ = self.globals
+
+            def store(f, value):
+                if globals_[index] is not _UNDECLARED:
+                    _redeclared(name)
+                globals_[index] = value
+            return store
+
+        def store(f, value):
+            f[index] = value
+        return store
+
+    def coerced(self, value, slot):
+        # Sayısal tipli yuvalara yazılan değer yerinde dönüştürülür
+        if slot.is_array or slot.type_token.type not in (TokenType.INT, TokenType.FLOAT):
+            return value
+        if slot.type_token.type == TokenType.INT:
+            return lambda f: int(v) if type(v := value(f)) is float else v
+        return lambda f: float(v) if type(v := value(f)) in (int, bool) else v
+
+    def if_statement(self, node):
+        condition = self.expression(node.condition)
+        then_fn, then_returns = self.statement(node.then_branch)
+        if node.else_branch is None:
+            if then_returns:
+                return (lambda f: then_fn(f) if condition(f) else None), True
+
+            def run(f):
+                if condition(f):
+                    then_fn(f)
+            return run, False
+        else_fn, else_returns = self.statement(node.else_branch)
+        if then_returns or else_returns:
+            then_fn = then_fn if then_returns else _effect(then_fn)
+            else_fn = else_fn if else_returns else _effect(else_fn)
+            return (lambda f: then_fn(f) if condition(f) else else_fn(f)), True
+
+        def run(f):
+            if condition(f):
+                then_fn(f)
+            else:
+                else_fn(f)
+        return run, False
+
+    def while_statement(self, node):
+        condition = self.expression(node.condition)
+        body, returns = self.statement(node.body)
+        if not returns:
+            def run(f):
+                while condition(f):
+                    body(f)
+            return run, False
+
+        def run(f):
+            while condition(f):
+                result = body(f)
+                if result is not None:
+                    return result
+        return run, True
+
+    def for_statement(self, node):
+        self.scopes.append({})
+        initializer = self.statement(node.initializer)[0] if node.initializer is not None else None
+        condition = self.expression(node.condition) if node.condition is not None else (lambda f: True)
+        increment = self.effect(node.increment) if node.increment is not None else None
+        body, returns = self.statement(node.body)
+        self.scopes.pop()
+        if increment is None:
+            increment = lambda f: None
+        if initializer is None:
+            initializer = lambda f: None
+        if not returns:
+            def run(f):
+                initializer(f)
+                while condition(f):
+                    body(f)
+                    increment(f)
+            return run, False
+
+        def run(f):
+            initializer(f)
+            while condition(f):
+                result = body(f)
+                if result is not None:
+                    return result
+                increment(f)
+        return run, True
+
+    # --- İfadeler ---
+
+    def constant(self, node):
+        """Düğüm derleme anında hesaplanabiliyorsa (True, değer) döndürür."""
+        if isinstance(node, Literal):
+            return True, literal_value(node.value)
+        if isinstance(node, Unary):
+            known, value = self.constant(node.right)
+            if known:
+                try:
+                    return True, UNARY_OPERATORS[node.operator.type](value)
+                except (TypeError, ExecutionError):
+                    pass
+        if isinstance(node, Binary) and node.operator.type in BINARY_OPERATORS:
+            left_known, left = self.constant(node.left)
+            right_known, right = self.constant(node.right)
+            if left_known and right_known:
+                try:
+                    return True, BINARY_OPERATORS[node.operator.type](left, right)
+                except (TypeError, ExecutionError):
+                    pass  # Hata çalışma anında, doğru yerde oluşsun
+        return False, None
+
+    def local_index(self, node):
+        if isinstance(node, Variable):
+            slot = self.resolve(node.name)
+            if not slot.is_global:
+                return slot.index
+        return None
+
+    def effect(self, node):
+        # Değeri kullanılmayan ifade; atamalar değer döndürmeden derlenir
+        if isinstance(node, Assignment):
+            return self.assignment(node, statement=True)
+        return self.expression(node)
+
+    def expression(self, node):
+        known, value = self.constant(node)
+        if known:
+            return lambda f: value
+        if isinstance(node, Variable):
+            slot = self.resolve(node.name)
+            index = slot.index
+            if slot.is_global:
+                globals_, name = self.globals, node.name
+
+                def read(f):
+                    value = globals_[index]
+                    if value is _UNDECLARED:
+                        _undeclared(name)
+                    return value
+                return read
+            return lambda f: f[index]
+        if isinstance(node, Assignment):
+            return self.assignment(node, statement=False)
+        if isinstance(node, Binary):
+            return self.binary(node)
+        if isinstance(node, Unary):
+            operation = UNARY_OPERATORS[node.operator.type]
+            right = self.expression(node.right)
+            return lambda f: operation(right(f))
+        if isinstance(node, Call):
+            return self.call(node)
+        if isinstance(node, ArrayAccess):
+            array, index, token = self.expression(node.name), self.expression(node.index), _node_token(node)
+
+            def access(f):
+                values, position = array(f), index(f)
+                if type(position) is int and 0 <= position < len(values):
+                    return values[position]
+                return index_value(values, position, token)
+            return access
+        if isinstance(node, PropertyAccess):
+            target, name = self.expression(node.object), node.property
+            if name.value != "length":
+                raise ExecutionError(f"Bilinmeyen özellik '{name.value}'.", name)
+            return lambda f: property_value(target(f), name)
+        raise ExecutionError(f"Çalıştırılamayan ifade: {type(node).__name__}.")
+
+    def binary(self, node):
+        operator_type = node.operator.type
+        if operator_type == TokenType.AND:
+            left, right = self.expression(node.left), self.expression(node.right)
+            return lambda f: bool(left(f) and right(f))
+        if operator_type == TokenType.OR:
+            left, right = self.expression(node.left), self.expression(node.right)
+            return lambda f: bool(left(f) or right(f))
+
+        left_index = self.local_index(node.left)
+        right_known, right_value = self.constant(node.right)
+        right_index = self.local_index(node.right)
+        if left_index is not None and right_known:
+            if operator_type in _LOCAL_CONST:
+                return _LOCAL_CONST[operator_type](left_index, right_value)
+            if operator_type == TokenType.PLUS and type(right_value) in (int, float):
+                return lambda f: v + right_value if type(v := f[left_index]) is not str else _add(v, right_value)
+        if left_index is not None and right_index is not None:
+            if operator_type in _LOCAL_LOCAL:
+                return _LOCAL_LOCAL[operator_type](left_index, right_index)
+            if operator_type == TokenType.PLUS:
+                return lambda f: _add(f[left_index], f[right_index])
+
+        operation = BINARY_OPERATORS[operator_type]
+        left = self.expression(node.left)
+        if right_known:
+            return lambda f: operation(left(f), right_value)
+        right = self.expression(node.right)
+        return lambda f: operation(left(f), right(f))
+
+    def assignment(self, node, statement):
+        value = self.expression(node.value)
+        target = node.target
+        if isinstance(target, Variable):
+            slot = self.resolve(target.name)
+            value = self.coerced(value, slot)
+            index = slot.index
+            if not slot.is_global:
+                if statement:
+                    def run(f):
+                        f[index] = value(f)
+                    return run
+
+                def run(f):
+                    f[index] = result = value(f)
+                    return result
+                return run
+            globals_, name = self.globals, target.name
+
+            def run(f):
+                result = value(f)
+                if globals_[index] is _UNDECLARED:
+                    _undeclared(name)
+                globals_[index] = result
+                return result
+            return run
+        if isinstance(target, ArrayAccess):
+            array, position, token = self.expression(target.name), self.expression(target.index), _node_token(target)
+
+            def run(f):
+                result = value(f)
+                store_index(array(f), position(f), result, token)
+                return result
+            return run
+        raise ExecutionError("Özelliklere atama yapılamaz.", target.property)
+
+    def call(self, node):
+        if not isinstance(node.callee, Variable):
+            raise ExecutionError("Yalnızca isimle fonksiyon çağrılabilir.")
+        name = node.callee.name
+        function = self.functions.get(name.value)
+        if function is None:
+            raise ExecutionError(f"Tanımsız fonksiyon '{name.value}'.", name)
+        declaration = function.declaration
+        if len(node.arguments) != len(declaration.parameters):
+            raise ExecutionError(
+                f"'{name.value}' {len(declaration.parameters)} argüman bekliyor, {len(node.arguments)} verildi.", name)
+        arguments = [
+            self.coerced(self.expression(argument), _Slot(index, False, parameter.type_token, parameter.is_array))
+            for index, (argument, parameter) in enumerate(zip(node.arguments, declaration.parameters))
+        ]
+        convert = lambda result: _return_value(declaration, result)
+        if not arguments:
+            return lambda f: convert(function.body([None] * function.size))
+        if len(arguments) == 1:
+            (first,) = arguments
+
+            def call_one(f):
+                frame = [None] * function.size
+                frame[0] = first(f)
+                return convert(function.body(frame))
+            return call_one
+        if len(arguments) == 2:
+            first, second = arguments
+
+            def call_two(f):
+                frame = [None] * function.size
+                frame[0] = first(f)
+                frame[1] = second(f)
+                return convert(function.body(frame))
+            return call_two
+
+        def call_many(f):
+            frame = [None] * function.size
+            for index, argument in enumerate(arguments):
+                frame[index] = argument(f)
+            return convert(function.body(frame))
+        return call_many
+
+
+def compile_program(program, output=print):
+    """Program AST'sini derler; CompiledProgram.run() ile çalıştırılır.
+
+    Tanımsız değişken/fonksiyon gibi hatalar derleme anında ExecutionError
+    olarak fırlatılır.
+    """
+    return _Compiler(program, output).compile()
+
+
+# --- Basit ziyaretçi yorumlayıcı ---
+
+class _ReturnSignal(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+class _Environment:
+    def __init__(self, parent=None):
+        self.values = {}
+        self.types = {}
+        self.parent = parent
+
+    def define(self, name, value, type_token, is_array):
+        self.values[name.value] = coerce(type_token, is_array, value)
+        self.types[name.value] = (type_token, is_array)
+
+    def find(self, name):
+        environment = self
+        while environment is not None:
+            if name.value in environment.values:
+                return environment
+            environment = environment.parent
+        raise ExecutionError(f"Tanımsız değişken '{name.value}'.", name)
+
+
+class Interpreter:
+    """AST üzerinde dolaşan, her düğümde tipe göre metot seçen yorumlayıcı."""
+
+    def __init__(self, program, output=print):
+        self.program = program
+        self.output = output
+        self.functions = {}
+        self.globals = _Environment()
+
+    def run(self):
+        self.functions = {node.name.value: node for node in self.program.statements
+                          if isinstance(node, FunctionDeclaration)}
+        self.globals = _Environment()
+        try:
+            _guard(self.execute_all, self.program.statements, self.globals)
+        except _ReturnSignal:
+            pass
+
+    def execute_all(self, statements, environment):
+        for node in statements:
+            self.execute(node, environment)
+
+    def execute(self, node, environment):
+        return getattr(self, "visit_" + type(node).__name__)(node, environment)
+
+    def visit_FunctionDeclaration(self, node, environment):
+        if environment is not self.globals:
+            raise ExecutionError("Fonksiyonlar yalnızca üst düzeyde tanımlanabilir.", node.name)
+
+    def visit_ErrorNode(self, node, environment):
+        raise ExecutionError(f"Hatalı deyim çalıştırılamaz: {node.error.message}", node.error.token)
+
+    def visit_Declaration(self, node, environment):
+        if node.initializer is None:
+            value = default_value(node.type_token, node.is_array)
+        else:
+            value = self.execute(node.initializer, environment)
+        if environment is self.globals and node.name.value in environment.values:
+            _redeclared(node.name)
+        environment.define(node.name, value, node.type_token, node.is_array)
+
+    def visit_ExpressionStatement(self, node, environment):
+        self.execute(node.expression, environment)
+
+    def visit_PrintStatement(self, node, environment):
+        self.output(format_value(self.execute(node.expression, environment)))
+
+    def visit_ReturnStatement(self, node, environment):
+        raise _ReturnSignal(None if node.value is None else self.execute(node.value, environment))
+
+    def visit_Block(self, node, environment):
+        self.execute_all(node.statements, _Environment(environment))
+
+    def visit_IfStatement(self, node, environment):
+        if self.execute(node.condition, environment):
+            self.execute(node.then_branch, environment)
+        elif node.else_branch is not None:
+            self.execute(node.else_branch, environment)
+
+    def visit_WhileStatement(self, node, environment):
+        while self.execute(node.condition, environment):
+            self.execute(node.body, environment)
+
+    def visit_ForStatement(self, node, environment):
+        scope = _Environment(environment)
+        if node.initializer is not None:
+            self.execute(node.initializer, scope)
+        while node.condition is None or self.execute(node.condition, scope):
+            self.execute(node.body, scope)
+            if node.increment is not None:
+                self.execute(node.increment, scope)
+
+    def visit_Literal(self, node, environment):
+        return literal_value(node.value)
+
+    def visit_Variable(self, node, environment):
+        return environment.find(node.name).values[node.name.value]
+
+    def visit_Assignment(self, node, environment):
+        value = self.execute(node.value, environment)
+        target = node.target
+        if isinstance(target, Variable):
+            scope = environment.find(target.name)
+            type_token, is_array = scope.types[target.name.value]
+            scope.values[target.name.value] = value = coerce(type_token, is_array, value)
+            return value
+        if isinstance(target, ArrayAccess):
+            store_index(self.execute(target.name, environment), self.execute(target.index, environment),
+                        value, _node_token(target))
+            return value
+        raise ExecutionError("Özelliklere atama yapılamaz.", target.property)
+
+    def visit_Binary(self, node, environment):
+        if node.operator.type == TokenType.AND:
+            return bool(self.execute(node.left, environment) and self.execute(node.right, environment))
+        if node.operator.type == TokenType.OR:
+            return bool(self.execute(node.left, environment) or self.execute(node.right, environment))
+        left = self.execute(node.left, environment)
+        right = self.execute(node.right, environment)
+        return BINARY_OPERATORS[node.operator.type](left, right)
+
+    def visit_Unary(self, node, environment):
+        return UNARY_OPERATORS[node.operator.type](self.execute(node.right, environment))
+
+    def visit_ArrayAccess(self, node, environment):
+        return index_value(self.execute(node.name, environment), self.execute(node.index, environment),
+                           _node_token(node))
+
+    def visit_PropertyAccess(self, node, environment):
+        return property_value(self.execute(node.object, environment), node.property)
+
+    def visit_Call(self, node, environment):
+        if not isinstance(node.callee, Variable) or node.callee.name.value not in self.functions:
+            raise ExecutionError("Tanımsız fonksiyon.", _node_token(node))
+        declaration = self.functions[node.callee.name.value]
+        if len(node.arguments) != len(declaration.parameters):
+            raise ExecutionError(f"'{declaration.name.value}' {len(declaration.parameters)} argüman bekliyor, "
+                                 f"{len(node.arguments)} verildi.", node.callee.name)
+        scope = _Environment(self.globals)
+        for argument, parameter in zip(node.arguments, declaration.parameters):
+            scope.define(parameter.name, self.execute(argument, environment),
+                         parameter.type_token, parameter.is_array)
+        try:
+            self.execute_all(declaration.body.statements, scope)
+        except _ReturnSignal as signal:
+            return coerce(declaration.return_type, declaration.is_array_return, signal.value)
+        return None
+
+
+if __name__ == "__main__":
+    import time
+    from .lexer import tokenize
+    from .parser import Parser
+
+    benchmark = """
+int fib(int n) {
+    if (n < 2) { return n; }
+    return fib(n - 1) + fib(n - 2);
+}
+int toplam = 0;
+int[] kareler;
+for (int i = 0; i < 300; i = i + 1) {
+    for (int j = 0; j < 300; j = j + 1) {
+        toplam = toplam + i * j / 7;
+    }
+    kareler[i] = i * i;
+}
+print(toplam);
+print(kareler.length);
+print(fib(20));
+"""
+    program = Parser(tokenize(benchmark)).parse()
+    results = {}
+    for name, make in (("ziyaretçi", lambda out: Interpreter(program, out)),
+                       ("closure", lambda out: compile_program(program, out))):
+        lines = []
+        started = time.perf_counter()
+        make(lines.append).run()
+        results[name] = lines
+        print(f"{name:>10}: {time.perf_counter() - started:.3f} sn {lines}", file=sys.stderr)
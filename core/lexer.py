@@ -1,4 +1,4 @@
-# lexer.py
+# core/lexer.py
 import re
 from enum import Enum, auto
 from dataclasses import dataclass
@@ -0,0 +1,145 @@
+# core/occurrences.py
+# Tanımlayıcı ve anahtar kelime değerlerinden token indekslerine ters indeks.
+# Yorum ve string içindeki metin bu token tiplerine dönüşmediği için
+# "int_count" aramaları yalnızca gerçek kullanımları bulur.
+from bisect import bisect_left, bisect_right, insort
+
+from .edits import changed_range
+from .lexer import TokenType
+
+INDEXED_TYPES = frozenset({
+    TokenType.IDENTIFIER,
+    TokenType.IF, TokenType.ELSE, TokenType.WHILE, TokenType.FOR, TokenType.RETURN,
+    TokenType.INT, TokenType.FLOAT, TokenType.STRING_TYPE, TokenType.BOOL,
+    TokenType.TRUE, TokenType.FALSE, TokenType.NULL, TokenType.PRINT,
+})
+
+
+# Bu kadar bekleyen kaydırmadan sonra indeks baştan kurulur; okunan her liste
+# bekleyen kaydırmaları kendisine uygular, uzun kuyruk okumayı yavaşlatır
+SHIFT_LIMIT = 32
+
+
+def _same(a, b, shift):
+    return a.type == b.type and a.value == b.value and a.start_pos + shift == b.start_pos
+
+
+def _start(token):
+    return token.start_pos
+
+
+def _end(token):
+    return token.end_pos
+
+
+class OccurrenceIndex:
+    def __init__(self, tokens=()):
+        self._build(list(tokens))
+
+    def _build(self, tokens):
+        self.tokens = tokens
+        self.postings = {}  # değer -> artan sıralı token indeksleri
+        for index, token in enumerate(tokens):
+            if token.type in INDEXED_TYPES:
+                self.postings.setdefault(token.value, []).append(index)
+        # Token sayısını değiştiren düzenlemelerin (ilk indeks, fark) kaydı;
+        # listeler kaydırmayı okunduklarında uygular
+        self._shifts = []
+        self._applied = dict.fromkeys(self.postings, 0)
+
+    def _posting(self, value):
+        posting = self.postings.get(value)
+        if posting is not None:
+            for first, delta in self._shifts[self._applied[value]:]:
+                position = bisect_left(posting, first)
+                posting[position:] = [index + delta for index in posting[position:]]
+            self._applied[value] = len(self._shifts)
+        return posting
+
+    def occurrences(self, value):
+        return [self.tokens[index] for index in self._posting(value) or ()]
+
+    def token_at(self, offset):
+        """`offset` konumunu içeren ya da tam orada biten indekslenmiş token'ın
+        indeksini, yoksa None döndürür."""
+        index = bisect_right(self.tokens, offset, key=_start) - 1
+        for candidate in (index, index - 1):
+            if 0 <= candidate < len(self.tokens):
+                token = self.tokens[candidate]
+                if token.type in INDEXED_TYPES and token.start_pos <= offset <= token.end_pos:
+                    return candidate
+        return None
+
+    def next_occurrence(self, value, offset, backwards=False):
+        """`offset`'ten sonraki (veya önceki) ilk geçişi, başa/sona sararak bulur.
+        Maliyet eşleşme sayısının logaritmasıyla orantılıdır."""
+        posting = self._posting(value)
+        if not posting:
+            return None
+        key = lambda index: self.tokens[index].start_pos
+        if backwards:
+            position = bisect_left(posting, offset, key=key) - 1
+        else:
+            position = bisect_right(posting, offset, key=key)
+        return self.tokens[posting[position % len(posting)]]
+
+    def update(self, tokens, edits=None):
+        """Yeni token akışına geçer; liste kopyalanmaz.
+
+        `edits`, eski akışın metnine sırayla uygulanmış EditDelta'lardır.
+        Değişen token aralığı bunlardan ikili aramayla bulunur ve yalnızca o
+        aralık yeniden indekslenir; sonraki indekslerin kayması listeler
+        okunana dek ertelenir. `edits` verilmezse indeks baştan kurulur.
+        """
+        window = changed_range(edits) if edits is not None else None
+        if window is None:
+            if edits is None or len(tokens) != len(self.tokens):
+                self._build(tokens)
+            else:
+                self.tokens = tokens
+            return
+        start, old_stop, new_stop = window
+        old = self.tokens
+        shift = new_stop - old_stop
+        # Lexer token sonundan en fazla iki karakter ileriye bakar ("1." + rakam)
+        first = min(bisect_left(old, start - 1, key=_end), bisect_left(tokens, start - 1, key=_end))
+        while first > 0 and not _same(old[first - 1], tokens[first - 1], 0):
+            first -= 1
+        # Düzenlemeden sonraki ilk ortak token'da akışlar yeniden birleşir:
+        # Lexer durumsuzdur, aynı konumdan sonrası aynı taranır
+        old_end = bisect_left(old, old_stop, key=_start)
+        new_end = bisect_left(tokens, new_stop, key=_start)
+        while old_end < len(old) and new_end < len(tokens):
+            a, b = old[old_end], tokens[new_end]
+            if _same(a, b, shift):
+                break
+            if a.start_pos + shift < b.start_pos:
+                old_end += 1
+            else:
+                new_end += 1
+        else:
+            old_end, new_end = len(old), len(tokens)
+
+        for index in range(first, old_end):
+            token = old[index]
+            if token.type in INDEXED_TYPES:
+                posting = self._posting(token.value)
+                del posting[bisect_left(posting, index)]
+                if not posting:
+                    del self.postings[token.value]
+                    del self._applied[token.value]
+        delta = (new_end - first) - (old_end - first)
+        if delta:
+            if len(self._shifts) >= SHIFT_LIMIT:
+                self._build(tokens)
+                return
+            self._shifts.append((old_end, delta))
+        for index in range(first, new_end):
+            token = tokens[index]
+            if token.type in INDEXED_TYPES:
+                posting = self._posting(token.value)
+                if posting is None:
+                    posting = self.postings[token.value] = []
+                    self._applied[token.value] = len(self._shifts)
+                insort(posting, index)
+        self.tokens = tokens
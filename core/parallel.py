@@ -0,0 +1,273 @@
+# core/parallel.py
+# Çok büyük programlar için paralel analiz yardımcıları.
+import multiprocessing
+import os
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+
+from .lexer import Lexer, Token, TokenType, tokenize
+from .parser import Parser, ParseError
+
+# Bu eşiklerin altında süreç havuzunun maliyeti kazancı aşar
+MIN_PARALLEL_TOKENS = 20000
+MIN_PARALLEL_CHARS = 200000
+
+# Bölme noktası içeremeyen yapılar; Lexer'ın kurallarıyla birebir aynı uçlar:
+# tek satır yorum satır sonunu da içerir, kapanmayan /* dosya sonuna kadar
+# sürer, string satır sonunda biter ama kaçışlı satır sonu stringe dahildir.
+_OPAQUE = re.compile(r"""//[^\n]*\n?|/\*[\s\S]*?(?:\*/|\Z)|"(?:[^"\\\n]|\\[\s\S]?)*"?|'(?:[^'\\\n]|\\[\s\S]?)*'?""")
+_TYPES_BY_VALUE = {token_type.value: token_type for token_type in TokenType}
+
+
+def find_split_points(code, count):
+    """Kodu `count` parçaya yakın bölen güvenli konumları döndürür.
+
+    Güvenli konum bir satır sonunun hemen arkasıdır ve yorum veya string
+    içinde değildir; Lexer orada her zaman iki token arasında, sütun 1'dedir.
+    """
+    points = []
+    floor = 0
+    match = _OPAQUE.search(code)
+    for i in range(1, count):
+        newline = code.find("\n", max(len(code) * i // count, floor))
+        while newline != -1:
+            split = newline + 1
+            while match and match.end() <= split:
+                match = _OPAQUE.search(code, match.end())
+            if match and match.start() < split:
+                # Satır sonu bir yorumun veya stringin içinde, yapının sonrasına geç
+                newline = code.find("\n", match.end() - 1)
+                continue
+            break
+        if newline == -1 or split >= len(code):
+            break
+        points.append(split)
+        floor = split
+    return points
+
+
+def _lex_chunk(job):
+    # Parça kendi Lexer'ıyla taranır, konumlar tüm dosyaya göre kaydırılır.
+    # Değerler gönderilmez, ana süreç onları kaynaktan dilimler; yalnızca
+    # dilimle uyuşmayanlar (EOF, bilinmeyen karakter) ayrıca taşınır.
+    text, base_pos, base_line = job
+    tokens = Lexer(text).tokenize()
+    values = {
+        index: token.value for index, token in enumerate(tokens)
+        if token.value != text[token.start_pos:token.end_pos]
+    }
+    return (
+        values,
+        bytes(token.type.value for token in tokens),
+        array("q", [token.start_pos + base_pos for token in tokens]).tobytes(),
+        array("q", [token.end_pos + base_pos for token in tokens]).tobytes(),
+        array("q", [token.line + base_line - 1 for token in tokens]).tobytes(),
+        array("q", [token.column for token in tokens]).tobytes(),
+    )
+
+
+def tokenize_parallel(code, max_workers=None, min_chars=MIN_PARALLEL_CHARS, chunks=None):
+    """tokenize(code) ile birebir aynı token listesini üretir.
+
+    Kod güvenli noktalardan parçalara bölünür ve parçalar süreç havuzunda
+    taranır. `max_workers=1` parçaları aynı süreçte işler.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if len(code) < min_chars:
+        return tokenize(code)
+    bounds = [0] + find_split_points(code, chunks or workers * 4) + [len(code)]
+    jobs = []
+    line = 1
+    for start, end in zip(bounds, bounds[1:]):
+        jobs.append((code[start:end], start, line))
+        line += code.count("\n", start, end)
+
+    if workers == 1:
+        results = [_lex_chunk(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_lex_chunk, jobs))
+
+    tokens = []
+    last = len(results) - 1
+    for index, (values, types, starts, ends, lines, columns) in enumerate(results):
+        starts, ends = array("q", starts), array("q", ends)
+        lines, columns = array("q", lines), array("q", columns)
+        # Son parça dışındaki parçaların EOF token'ı atılır
+        count = len(types) if index == last else len(types) - 1
+        for i in range(count):
+            start, end = starts[i], ends[i]
+            value = values[i] if i in values else code[start:end]
+            tokens.append(Token(_TYPES_BY_VALUE[types[i]], value, start, end, lines[i], columns[i]))
+    return tokens
+
+
+# Derinlik değişimleri: tip bayt dizisi bu tablolarla çevrilip biriktirilir,
+# böylece derinlik taraması Python döngüsü olmadan yapılır
+_BRACE_CHANGES = {TokenType.LEFT_BRACE: 1, TokenType.RIGHT_BRACE: -1}
+_NESTING_CHANGES = {TokenType.LEFT_PAREN: 1, TokenType.LEFT_BRACKET: 1,
+                    TokenType.RIGHT_PAREN: -1, TokenType.RIGHT_BRACKET: -1}
+_ENDS = frozenset((TokenType.SEMICOLON.value, TokenType.RIGHT_BRACE.value))
+
+
+def _running_depth(types, changes):
+    table = bytearray(256)
+    for token_type, change in changes.items():
+        table[token_type.value] = change & 0xFF
+    return list(accumulate(array("b", types.translate(table))))
+
+
+def split_top_level(tokens, count):
+    """Yorumları ayıklanmış token listesini üst düzey sınırlardan yaklaşık
+    `count` eşit parçaya böler.
+
+    Sınır: süslü parantez derinliği 0 iken gelen ';' veya '}' (ardından 'else'
+    gelmiyorsa); for başlığındaki ';' ( ve [ içinde olduğu için sayılmaz.
+    (başlangıç, bitiş) aralıklarının listesini, parantezler dengesizse None
+    döndürür.
+    """
+    end = len(tokens) - 1  # Son token EOF
+    types = bytes(token.type.value for token in tokens)
+    depths = _running_depth(types, _BRACE_CHANGES)
+    nestings = _running_depth(types, _NESTING_CHANGES)
+    if min(depths, default=0) < 0 or min(nestings, default=0) < 0:
+        return None
+    bounds = [0]
+    for i in range(1, count):
+        index = max(end * i // count, bounds[-1])
+        while index < end and not (
+                depths[index] == 0 and nestings[index] == 0 and types[index] in _ENDS
+                and types[index + 1] != TokenType.ELSE.value):
+            index += 1
+        if index >= end - 1:
+            break
+        bounds.append(index + 1)
+    bounds.append(end)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _segment_tokens(tokens, start, end):
+    # Her parçaya, parçanın hemen sonrasını gösteren kendi EOF token'ı eklenir
+    after = tokens[end]
+    eof = Token(TokenType.EOF, "EOF", after.start_pos, after.start_pos, after.line, after.column)
+    return tokens[start:end] + [eof]
+
+
+# İşçi süreçte paylaşılan token listesi. "fork" ile başlatılan işçiler listeyi
+# kopyalamadan devralır; görevler yalnızca (başlangıç, bitiş) aralığı taşır ve
+# yalnızca parçanın hatasız olup olmadığını döndürür: AST süreç sınırından
+# geçmez.
+_tokens = None
+
+
+def _init_worker(tokens):
+    global _tokens
+    _tokens = tokens
+
+
+def _check_segment(bounds):
+    try:
+        Parser(_segment_tokens(_tokens, *bounds)).parse()
+    except ParseError:
+        return False
+    return True
+
+
+def _pool(workers, tokens):
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        context = None  # fork yoksa token listesi işçi başına bir kez kopyalanır
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=_init_worker, initargs=(tokens,))
+
+
+def check_parallel(tokens, max_workers=None, min_tokens=MIN_PARALLEL_TOKENS):
+    """Parser(tokens).parse()'ın fırlatacağı ParseError'ı, hatasız kodda
+    None'ı döndürür; çok sayıda üretilmiş kaynağın toplu denetimi içindir.
+
+    Üst düzey parçalar süreç havuzunda ayrıştırılır; işçiler AST yerine
+    parça başına tek bir doğru/yanlış döndürür, böylece ana süreçte sıralı
+    kalan iş yorum ayıklama ve derinlik taramasıdır. İlk hatalı parça ana
+    süreçte sıralı ayrıştırılır: hata iletisi ve token'ı Parser.parse ile
+    birebir aynıdır. `max_workers=1` parçaları aynı süreçte işler.
+    """
+    parser = Parser(tokens)
+    workers = max_workers or os.cpu_count() or 1
+    segments = None
+    if len(parser.tokens) >= min_tokens:
+        segments = split_top_level(parser.tokens, workers * 4)
+    if segments is None or len(segments) < 2:
+        try:
+            parser.parse()
+        except ParseError as error:
+            return error
+        return None
+
+    if workers == 1:
+        _init_worker(parser.tokens)
+        try:
+            results = [_check_segment(segment) for segment in segments]
+        finally:
+            _init_worker(None)
+    else:
+        with _pool(workers, parser.tokens) as pool:
+            results = list(pool.map(_check_segment, segments))
+
+    if all(results):
+        return None
+    # İlk hatalı parçadan itibaren sıralı ayrıştır. Parça tek başına
+    # ayrıştırılınca hata vermiş ama sıralı ayrıştırmada sonraki parçayla
+    # birlikte geçerli olabilir; o yüzden dosya sonuna dek sürdürülür.
+    parser.current = segments[results.index(False)][0]
+    try:
+        while not parser.is_at_end():
+            parser.declaration()
+    except ParseError as error:
+        return error
+    return None
+
+
+if __name__ == "__main__":
+    import time
+
+    function = "int f{0}(int a, int b) {{\n    for (int i = 0; i < a; i = i + 1) {{ b = b + i * 2; }}\n    if (a > b) {{ return a; }} else {{ return b; }}\n}}\n"
+    code = "".join(function.format(i) for i in range(5000))
+
+    started = time.perf_counter()
+    tokens = tokenize(code)
+    print(f"sıralı lexer  : {time.perf_counter() - started:.3f} sn")
+
+    started = time.perf_counter()
+    parallel_tokens = tokenize_parallel(code)
+    print(f"paralel lexer : {time.perf_counter() - started:.3f} sn, aynı sonuç: {parallel_tokens == tokens}")
+
+    started = time.perf_counter()
+    Parser(tokens).parse()
+    print(f"sıralı parser  : {time.perf_counter() - started:.3f} sn")
+
+    # Ana süreçte sıralı kalan kısım ve işçilerin toplam işi; N çekirdekte
+    # süre kabaca ana süreç + işçi işi / N olur
+    workers = os.cpu_count() or 1
+    started = time.perf_counter()
+    segments = split_top_level(Parser(tokens).tokens, workers * 4)
+    print(f"ana süreç (ayıklama + bölme): {time.perf_counter() - started:.3f} sn")
+    _init_worker(Parser(tokens).tokens)
+    started = time.perf_counter()
+    for segment in segments:
+        _check_segment(segment)
+    print(f"işçi işi (toplam): {time.perf_counter() - started:.3f} sn, {len(segments)} parça")
+    _init_worker(None)
+
+    started = time.perf_counter()
+    error = check_parallel(tokens)
+    print(f"paralel denetim ({workers} işçi): {time.perf_counter() - started:.3f} sn, hata: {error}")
+
+    broken = tokens[:len(tokens) * 3 // 4] + [tokens[5]] + tokens[len(tokens) * 3 // 4:]
+    try:
+        Parser(broken).parse()
+    except ParseError as expected:
+        error = check_parallel(broken)
+        print(f"hatalı girdide aynı hata: {str(error) == str(expected) and error.token is expected.token}")
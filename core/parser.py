@@ -1,7 +1,8 @@
-# parser.py
+# core/parser.py
+import time
 from dataclasses import dataclass, field
 from typing import List, Optional
-from lexer import TokenType, Token # TokenType enum'ını import ediyoruz ve Token sınıfını içe aktar
+from .lexer import TokenType, Token # TokenType enum'ını import ediyoruz ve Token sınıfını içe aktar
 
 class ParseError(Exception):
     def __init__(self, message, token=None):
@@ -118,10 +119,124 @@ class Variable(ASTNode):
 class Literal(ASTNode):
     value: Token
 
+@dataclass
+class ErrorNode(ASTNode):
+    """Hata kurtarma modunda, ayrıştırılamayan bildirimin yerini tutar."""
+    error: ParseError
+    tokens: List[Token]
+
+class LazyBlock(Block):
+    """Ayrıştırılması ilk erişime ertelenen fonksiyon gövdesi.
+
+    [start, end) gövdenin '{' sonrasından eşleşen '}' token'ına kadarki
+    aralığıdır. statements'a erişmek ya da materialize() çağırmak gövdeyi
+    ayrıştırır; kurtarma modunda bulunan hatalar sahibi parser'ın errors
+    listesine eklenir.
+    """
+
+    def __init__(self, parser, start, end):
+        self.parser = parser
+        self.start = start
+        self.end = end
+        self._block = None
+
+    @property
+    def open_brace(self):
+        return self.parser.tokens[self.start - 1]
+
+    @property
+    def close_brace(self):
+        return self.parser.tokens[self.end]
+
+    @property
+    def parsed(self):
+        return self._block is not None
+
+    @property
+    def statements(self):
+        return self.materialize().statements
+
+    def materialize(self):
+        if self._block is None:
+            parser = self.parser.fork(self.start)
+            try:
+                self._block = parser.block()
+            except ParseError as error:
+                if not parser.recover:
+                    raise
+                parser.errors.append(error)
+                self._block = Block([ErrorNode(error, parser.tokens[self.start:self.end])])
+            else:
+                if parser.current != self.end + 1:
+                    self._parse_rest(parser)
+            self.parser.errors.extend(parser.errors)
+        return self._block
+
+    def _parse_rest(self, parser):
+        # Kurtarma modunda synchronize() bir '{' tüketebilir ama '}' tüketmez;
+        # blok bu yüzden eşleşen '}'den önce kapanabilir. Kalan kısım da gövdeye
+        # ayrıştırılır ki tanıları kaybolmasın (eager parse bu token'ları üst
+        # düzeyde ayrıştırır; ilk hata her iki yolda da aynıdır).
+        parser.block_depth += 1
+        while parser.current < self.end:
+            before = parser.current
+            self._block.statements.append(parser.declaration())
+            if parser.current == before:
+                parser.advance()  # Fazla '}' zaten hata olarak kaydedildi
+        parser.block_depth -= 1
+        parser.advance()  # Eşleşen '}'
+
+    def __eq__(self, other):
+        if not isinstance(other, Block):
+            return NotImplemented
+        return self.statements == other.statements
+
+    def __repr__(self):
+        if self._block is None:
+            return f"LazyBlock(satır {self.open_brace.line}-{self.close_brace.line}, ayrıştırılmadı)"
+        return f"LazyBlock(statements={self._block.statements!r})"
+
+
+_OPENERS = {TokenType.LEFT_BRACE: TokenType.RIGHT_BRACE,
+            TokenType.LEFT_PAREN: TokenType.RIGHT_PAREN,
+            TokenType.LEFT_BRACKET: TokenType.RIGHT_BRACKET}
+_CLOSERS = frozenset(_OPENERS.values())
+
+
+def _matching_brace(tokens, start):
+    # '{' sonrasından başlayıp eşleşen '}' indeksini döndürür. Parantez veya
+    # köşeli parantez dengesizse ya da '}' yoksa None: gövde kesin hatalıdır
+    expected = [TokenType.RIGHT_BRACE]
+    for index in range(start, len(tokens)):
+        token_type = tokens[index].type
+        if token_type in _OPENERS:
+            expected.append(_OPENERS[token_type])
+        elif token_type in _CLOSERS:
+            if expected.pop() != token_type:
+                return None
+            if not expected:
+                return index
+    return None
+
 class Parser:
-    def __init__(self, tokens):
+    def __init__(self, tokens, recover=False, lazy_bodies=False):
         self.tokens = [t for t in tokens if t.type not in (TokenType.COMMENT, TokenType.MULTILINE_COMMENT)]
         self.current = 0
+        # recover=True: hatalar self.errors'a yazılır, yerlerine ErrorNode konur
+        # ve ayrıştırma senkronizasyon noktasından devam eder
+        self.recover = recover
+        self.errors = []
+        self.block_depth = 0
+        # lazy_bodies=True: fonksiyon gövdeleri atlanır, LazyBlock olarak kaydedilir
+        self.lazy_bodies = lazy_bodies
+        self.lazy_blocks = []
+
+    def fork(self, position):
+        # Aynı token listesini paylaşan, `position`'dan başlayan eager parser
+        parser = Parser((), self.recover)
+        parser.tokens = self.tokens
+        parser.current = position
+        return parser
 
     def parse(self):
         statements = []
@@ -130,6 +245,7 @@ class Parser:
         return Program(statements)
 
     def declaration(self):
+        start = self.current
         try:
             if self.check(TokenType.INT, TokenType.FLOAT, TokenType.STRING_TYPE, TokenType.BOOL):
                 # Bir sonraki token'a bakarak fonksiyon mu değişken mi olduğuna karar ver
@@ -154,7 +270,10 @@ class Parser:
             return self.statement()
         except ParseError as error:
             self.synchronize()
-            raise error # Hatayı tekrar fırlat ki GUI yakalasın
+            if not self.recover:
+                raise error # Hatayı tekrar fırlat ki GUI yakalasın
+            self.errors.append(error)
+            return ErrorNode(error, self.tokens[start:self.current])
 
     def function_declaration(self):
         return_type = self.advance()
@@ -180,7 +299,7 @@ class Parser:
                     break
         self.consume(TokenType.RIGHT_PAREN, "')' bekleniyordu.")
         self.consume(TokenType.LEFT_BRACE, "Fonksiyon gövdesi için '{' bekleniyordu.")
-        body = self.block()
+        body = self.lazy_block() if self.lazy_bodies else self.block()
         return FunctionDeclaration(return_type, name, parameters, body, is_array_return)
 
     def variable_declaration(self):
@@ -271,11 +390,26 @@ class Parser:
 
     def block(self):
         statements = []
-        while not self.check(TokenType.RIGHT_BRACE) and not self.is_at_end():
-            statements.append(self.declaration())
+        self.block_depth += 1
+        try:
+            while not self.check(TokenType.RIGHT_BRACE) and not self.is_at_end():
+                statements.append(self.declaration())
+        finally:
+            self.block_depth -= 1
         self.consume(TokenType.RIGHT_BRACE, "Blok sonrası '}' bekleniyordu.")
         return Block(statements)
 
+    def lazy_block(self):
+        # Gövde eşleşen '}'e kadar atlanır. Dengesiz gövde hemen ayrıştırılır:
+        # tanı kaybolmaz ve hata eager parse ile aynı token'da oluşur.
+        end = _matching_brace(self.tokens, self.current)
+        if end is None:
+            return self.block()
+        body = LazyBlock(self, self.current, end)
+        self.lazy_blocks.append(body)
+        self.current = end + 1
+        return body
+
     def expression_statement(self):
         expr = self.expression()
         self.consume(TokenType.SEMICOLON, "İfade sonrası ';' bekleniyordu.")
@@ -421,10 +555,50 @@ class Parser:
         return self.tokens[self.current - 1]
 
     def synchronize(self):
-        self.advance()
+        # Kurtarma modunda blok içindeyken '}' tüketilmez ki blok kendi
+        # kapanışını bulabilsin ve hata dışarıya taşmasın; bildirim başlatan
+        # tip anahtar kelimelerinde de durulur
+        keep_brace = self.recover and self.block_depth > 0
+        if not (keep_brace and self.check(TokenType.RIGHT_BRACE)):
+            self.advance()
         while not self.is_at_end():
             if self.previous().type == TokenType.SEMICOLON:
                 return
             if self.peek().type in [TokenType.FOR, TokenType.IF, TokenType.WHILE, TokenType.PRINT, TokenType.RETURN]:
                 return
+            if keep_brace and self.peek().type == TokenType.RIGHT_BRACE:
+                return
+            if self.recover and self.check(TokenType.INT, TokenType.FLOAT, TokenType.STRING_TYPE, TokenType.BOOL):
+                return # Yeni bir bildirim başlıyor
             self.advance()
+
+
+class ResumableParse:
+    """Parser.parse() ile aynı sonucu zaman dilimleri hâlinde üretir.
+
+    Kontrol noktaları üst düzey bildirimlerdir: run() süre dolunca bir sonraki
+    bildirimden önce durur ve tekrar çağrıldığında kaldığı yerden devam eder.
+    """
+
+    def __init__(self, tokens, recover=False, lazy_bodies=False):
+        self.parser = Parser(tokens, recover, lazy_bodies)
+        self.statements = []
+        self.program = None
+
+    @property
+    def done(self):
+        return self.program is not None
+
+    def run(self, budget):
+        """En fazla yaklaşık `budget` saniye ayrıştırır; bittiyse True döndürür.
+
+        Hata, parse() ile aynı şekilde ParseError olarak fırlatılır; kurtarma
+        modunda ise parser.errors listesinde toplanır.
+        """
+        deadline = time.perf_counter() + budget
+        while not self.parser.is_at_end():
+            self.statements.append(self.parser.declaration())
+            if time.perf_counter() >= deadline and not self.parser.is_at_end():
+                return False
+        self.program = Program(self.statements)
+        return True
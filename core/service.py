@@ -0,0 +1,154 @@
+# core/service.py
+# Lexer/Parser'ı asyncio tabanlı sunuculara açan analiz servisi. Her belge
+# için yalnızca en yeni sürüm analiz edilir; yeni sürüm geldiğinde süren iş
+# iptal edilir.
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .document import Document
+from .lexer import Token, tokenize
+from .parser import Parser, Program, ParseError
+
+
+@dataclass
+class AnalysisResult:
+    doc_id: object
+    version: int
+    tokens: List[Token]
+    diagnostics: List[ParseError] = field(default_factory=list)
+    program: Optional[Program] = None
+
+
+class _Superseded(Exception):
+    """Çalıştırıcıdaki iş, belgenin daha yeni sürümü geldiği için bırakıldı."""
+
+
+def _analyze(snapshot, cancelled):
+    # Çalıştırıcıda çalışır. Metin belgenin anlık görüntüsünden burada
+    # birleştirilir; olay döngüsü yalnızca O(log n) düzenlemeyi uygular.
+    # Lexer ve Parser kesilemediği için iptal bayrağı taramadan sonra ve her
+    # üst düzey bildirimden sonra yoklanır. Kurtarma modu sayesinde tüm
+    # hatalar ve kısmi AST tek geçişte döner.
+    tokens = tokenize(snapshot.text())
+    if cancelled.is_set():
+        raise _Superseded()
+    parser = Parser(tokens, recover=True)
+    statements = []
+    while not parser.is_at_end():
+        statements.append(parser.declaration())
+        if cancelled.is_set():
+            raise _Superseded()
+    return tokens, Program(statements), parser.errors
+
+
+class _Document:
+    def __init__(self):
+        self.buffer = Document()
+        self.version = 0
+        self.task = None
+        self.cancelled = None
+
+    def cancel(self):
+        if self.task is not None and not self.task.done():
+            self.cancelled.set()
+            self.task.cancel()
+
+
+class HighlightService:
+    """Eşzamanlı düzenleme oturumları için analiz servisi.
+
+    `executor` iş parçacığı tabanlı olmalıdır; iptal, işle paylaşılan bir
+    threading.Event üzerinden yapılır. Süreç başına en fazla
+    `max_concurrency` analiz aynı anda çalışır.
+    """
+
+    def __init__(self, max_concurrency=None, executor=None):
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="highlight")
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._documents = {}
+
+    async def analyze(self, doc_id, text_or_edit):
+        """Belgenin yeni sürümünü analiz eder ve AnalysisResult döndürür.
+
+        `text_or_edit` tam metin ya da son sürüme uygulanacak
+        (konum, silinen_uzunluk, eklenen_metin) düzenlemesidir. Daha yeni bir
+        sürüm gelirse bu çağrı asyncio.CancelledError ile sonlanır.
+        """
+        document = self._documents.setdefault(doc_id, _Document())
+        if isinstance(text_or_edit, str):
+            document.buffer = Document(text_or_edit)
+        else:
+            document.buffer.apply(text_or_edit)
+        document.version += 1
+        document.cancel()
+        document.cancelled = threading.Event()
+        document.task = asyncio.ensure_future(
+            self._run(doc_id, document.version, document.buffer.snapshot(), document.cancelled))
+        return await document.task
+
+    async def _run(self, doc_id, version, snapshot, cancelled):
+        loop = asyncio.get_running_loop()
+        await self._semaphore.acquire()
+        try:
+            future = self._executor.submit(_analyze, snapshot, cancelled)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        # Yuva, iş parçacığı gerçekten bittiğinde boşalır; iptal edilen ama
+        # hâlâ çalışan işler sınırın dışına taşmaz
+        future.add_done_callback(lambda _: self._release(loop))
+        try:
+            tokens, program, diagnostics = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        except _Superseded:
+            raise asyncio.CancelledError()
+        return AnalysisResult(doc_id, version, tokens, diagnostics, program)
+
+    def _release(self, loop):
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._semaphore.release)
+
+    def close(self, doc_id):
+        """Belgeyi unutur ve süren analizini iptal eder."""
+        document = self._documents.pop(doc_id, None)
+        if document is not None:
+            document.cancel()
+
+    async def aclose(self):
+        for doc_id in list(self._documents):
+            self.close(doc_id)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+if __name__ == "__main__":
+    async def demo():
+        async with HighlightService(max_concurrency=2) as service:
+            code = "int f(int a) { return a; }\n" * 2000
+            first = asyncio.ensure_future(service.analyze("belge", code))
+            await asyncio.sleep(0)
+            # Yeni sürüm gelince ilk istek iptal edilir
+            latest = await service.analyze("belge", (len(code), 0, "print(f(1))"))
+            try:
+                await first
+            except asyncio.CancelledError:
+                print("1. sürüm iptal edildi")
+            print(f"{latest.version}. sürüm: {len(latest.tokens)} token, "
+                  f"{[str(d) for d in latest.diagnostics]}")
+
+    asyncio.run(demo())
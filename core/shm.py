@@ -0,0 +1,286 @@
+# core/shm.py
+# İşçi süreçlerden token sütunlarının paylaşımlı bellek üzerinden kopyasız
+# aktarımı. İşçiler parçayı tarar, tip, konum, satır ve sütun sütunlarını
+# token sayısına göre boyutlanmış bir segmente yazar (havuzun önerdiği boşta
+# segment yetiyorsa o kullanılır) ve yalnızca segment adı, token sayısı ve
+# kaynaktan dilimlenemeyen değerleri döndürür. Ana süreç segmenti sahiplenir,
+# sütunları kopyalamadan eşler ve Token nesnelerini erişildikçe üretir.
+import os
+import secrets
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from .lexer import Lexer, Token, TokenType
+from .parallel import find_split_points
+
+_TYPES_BY_VALUE = {token_type.value: token_type for token_type in TokenType}
+_COLUMNS = 4  # start_pos, end_pos, line, column
+
+
+def _layout(count, typecode):
+    # [tipler: count bayt][8'e hizalama][4 sütun x count x genişlik]
+    base = (count + 7) & ~7
+    width = array(typecode).itemsize
+    return base, width, base + _COLUMNS * count * width
+
+
+class SegmentPool:
+    """Ana sürecin sahip olduğu paylaşımlı bellek segmentleri.
+
+    Segmentleri işçiler oluşturur, ana süreç adopt() ile sahiplenir.
+    Serbest bırakılan segmentler sonraki analiz nesillerinde işçilere
+    yedek olarak önerilir; en fazla `max_free` tanesi boşta tutulur,
+    fazlası silinir.
+    """
+
+    def __init__(self, max_free=8):
+        self.max_free = max_free
+        self._free = []
+        self._leased = {}  # segment adı -> (segment, sahibi olan TokenArray)
+
+    def spares(self, count, owner):
+        """Boştaki en büyük `count` segmenti büyükten küçüğe ödünç verir."""
+        self._free.sort(key=lambda segment: segment.size, reverse=True)
+        spares, self._free = self._free[:count], self._free[count:]
+        for segment in spares:
+            self._leased[segment.name] = (segment, owner)
+        return spares
+
+    def adopt(self, name, owner):
+        """İşçinin oluşturduğu segmenti açar ve havuza bağlar."""
+        segment = SharedMemory(name=name)
+        self._leased[segment.name] = (segment, owner)
+        return segment
+
+    def give_back(self, segment):
+        self._leased.pop(segment.name, None)
+        if len(self._free) < self.max_free:
+            self._free.append(segment)
+        else:
+            segment.close()
+            segment.unlink()
+
+    def close(self):
+        # Hâlâ kullanılan diziler önce bırakılır ki görünümleri segmenti kilitlemesin
+        for _, owner in list(self._leased.values()):
+            owner.release()
+        for segment in self._free:
+            segment.close()
+            segment.unlink()
+        self._free = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _lex_into_segment(job):
+    # İşçide çalışır: parça taranır, sütunlar yedek segmente (yetiyorsa) ya
+    # da `name` adıyla token sayısı kadar açılan yeni segmente yazılır. Son
+    # parça dışındaki EOF token'ları sayılmaz; değeri dilimle uyuşmayanlar döner.
+    text, base_pos, base_line, name, spare, typecode, keep_eof = job
+    tokens = Lexer(text).tokenize()
+    if not keep_eof:
+        tokens.pop()
+    values = {
+        index: token.value for index, token in enumerate(tokens)
+        if token.value != text[token.start_pos:token.end_pos]
+    }
+    count = len(tokens)
+    base, width, size = _layout(count, typecode)
+    if spare is not None and spare[1] >= size:
+        segment = SharedMemory(name=spare[0])
+    else:
+        segment = SharedMemory(name=name, create=True, size=max(size, 1))
+        # Sahibi ana süreçtir: işçi çıkarken izleyicisi segmenti silmesin
+        resource_tracker.unregister(segment._name, "shared_memory")
+    try:
+        buffer = segment.buf
+        buffer[:len(tokens)] = bytes(token.type.value for token in tokens)
+        columns = (
+            [token.start_pos + base_pos for token in tokens],
+            [token.end_pos + base_pos for token in tokens],
+            [token.line + base_line - 1 for token in tokens],
+            [token.column for token in tokens],
+        )
+        for number, column in enumerate(columns):
+            offset = base + number * count * width
+            buffer[offset:offset + count * width] = memoryview(array(typecode, column)).cast("B")
+        del buffer
+    finally:
+        segment.close()
+    return segment.name, count, values
+
+
+class TokenArray(Sequence):
+    """Paylaşımlı bellekteki token sütunlarının Token uyumlu görünümü.
+
+    Token nesneleri yalnızca erişildiğinde üretilir; değerler kaynak koddan
+    dilimlenir. release() sonrasında dizi okunamaz, üretilmiş Token'lar
+    geçerliliğini korur.
+    """
+
+    def __init__(self, code, pool):
+        self.code = code
+        self._pool = pool
+        self._parts = []   # (segment, sayı, değerler, tipler, başlar, bitişler, satırlar, sütunlar)
+        self._firsts = []  # Her parçanın ilk token'ının genel indeksi
+        self._length = 0
+        self.released = False
+
+    def _attach(self, segment, typecode, count, values):
+        base, width, _ = _layout(count, typecode)
+        buffer = segment.buf
+        columns = [
+            buffer[base + number * count * width:base + (number + 1) * count * width].cast(typecode)
+            for number in range(_COLUMNS)
+        ]
+        self._parts.append((segment, count, values, buffer[:count], *columns))
+        self._firsts.append(self._length)
+        self._length += count
+
+    def __len__(self):
+        return self._length
+
+    def _check(self):
+        if self.released:
+            raise ValueError("TokenArray serbest bırakıldı")
+
+    def _token(self, part, i):
+        _, _, values, types, starts, ends, lines, columns = part
+        start, end = starts[i], ends[i]
+        value = values[i] if i in values else self.code[start:end]
+        return Token(_TYPES_BY_VALUE[types[i]], value, start, end, lines[i], columns[i])
+
+    def __getitem__(self, index):
+        self._check()
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("token indeksi aralık dışında")
+        part = bisect_right(self._firsts, index) - 1
+        return self._token(self._parts[part], index - self._firsts[part])
+
+    def __iter__(self):
+        self._check()
+        for part in self._parts:
+            for i in range(part[1]):
+                yield self._token(part, i)
+
+    def release(self):
+        """Görünümleri kapatır ve segmentleri havuza geri verir."""
+        if self.released:
+            return
+        self.released = True
+        for segment, _, _, *views in self._parts:
+            for view in views:
+                view.release()
+            self._pool.give_back(segment)
+        self._parts = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+def tokenize_shared(code, pool, max_workers=None, chunks=None, executor=None):
+    """tokenize(code) ile aynı token'ları paylaşımlı bellekte bir TokenArray
+    olarak döndürür. Bir önceki neslin dizisi işi bitince release() ile
+    bırakılmalıdır; segmentleri sonraki çağrılarda yeniden kullanılır.
+
+    `executor` verilirse (uzun ömürlü ProcessPoolExecutor) o kullanılır;
+    `max_workers=1` parçaları aynı süreçte işler.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    bounds = [0] + find_split_points(code, chunks or workers * 4) + [len(code)]
+    typecode = "i" if len(code) < 2 ** 31 - 1 else "q"
+    result = TokenArray(code, pool)
+    ranges = list(zip(bounds, bounds[1:]))
+    # Önceki nesillerin segmentleri en uzun parçalara yedek olarak önerilir
+    spares = [None] * len(ranges)
+    longest = sorted(range(len(ranges)), key=lambda n: ranges[n][1] - ranges[n][0], reverse=True)
+    for number, segment in zip(longest, pool.spares(len(ranges), result)):
+        spares[number] = segment
+    names = [f"psm_{secrets.token_hex(8)}" for _ in ranges]
+    jobs = []
+    line = 1
+    for number, (start, end) in enumerate(ranges):
+        spare = spares[number] and (spares[number].name, spares[number].size)
+        jobs.append((code[start:end], start, line, names[number], spare, typecode, number == len(ranges) - 1))
+        line += code.count("\n", start, end)
+
+    try:
+        if executor is not None:
+            outputs = list(executor.map(_lex_into_segment, jobs))
+        elif workers == 1:
+            outputs = [_lex_into_segment(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool_executor:
+                outputs = list(pool_executor.map(_lex_into_segment, jobs))
+    except BaseException:
+        for spare in spares:
+            if spare is not None:
+                pool.give_back(spare)
+        _unlink_created(names)
+        raise
+
+    for spare, (name, count, values) in zip(spares, outputs):
+        if spare is not None and spare.name == name:
+            segment = spare
+        else:
+            if spare is not None:
+                pool.give_back(spare)
+            segment = pool.adopt(name, result)
+        result._attach(segment, typecode, count, values)
+    return result
+
+
+def _unlink_created(names):
+    # Başarısız bir işten önce işçilerin açtığı segmentler silinir
+    for name in names:
+        try:
+            segment = SharedMemory(name=name)
+        except FileNotFoundError:
+            continue
+        segment.close()
+        segment.unlink()
+
+
+if __name__ == "__main__":
+    import pickle
+    import time
+    from .lexer import tokenize
+
+    function = "int f{0}(int a, int b) {{\n    for (int i = 0; i < a; i = i + 1) {{ b = b + i * 2; }}\n    if (a > b) {{ return a; }} else {{ return b; }}\n}}\n"
+    code = "".join(function.format(i) for i in range(1000))
+    reference = tokenize(code)
+
+    # Süreç sınırından geçen veri: Token listesi ile paylaşımlı bellek yanıtı
+    started = time.perf_counter()
+    pickle.loads(pickle.dumps(reference))
+    print(f"Token listesi pickle: {len(pickle.dumps(reference)) / 1e6:.2f} MB, "
+          f"gidiş-dönüş {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    with SegmentPool() as pool:
+        for generation in range(3):
+            started = time.perf_counter()
+            tokens = tokenize_shared(code, pool, max_workers=2)
+            elapsed = time.perf_counter() - started
+            # İşçilerin gerçekte döndürdüğü (ad, sayı, değerler) yanıtları
+            replies = [pickle.dumps((part[0].name, part[1], part[2])) for part in tokens._parts]
+            segments = sum(part[0].size for part in tokens._parts)
+            same = list(tokens) == reference
+            tokens.release()
+            print(f"{generation + 1}. nesil: {elapsed:.3f} sn, işçi yanıtları {sum(map(len, replies))} bayt "
+                  f"({len(replies)} parça), segmentler {segments / len(code):.1f} bayt/karakter, "
+                  f"aynı sonuç: {same}, boşta segment: {len(pool._free)}")
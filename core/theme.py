@@ -0,0 +1,76 @@
+# core/theme.py
+# Renk şeması verisi; tkinter içermez, başsız süreçler de kullanabilir.
+from .lexer import TokenType
+
+class ModernTheme:
+    BG_COLOR = "#1a1b26"  # Daha koyu ve modern bir arka plan
+    TEXT_BG = "#24283b"   # Kod editörü arka planı
+    TEXT_FG = "#a9b1d6"   # Daha yumuşak bir metin rengi
+    LINE_NUM_BG = "#1a1b26"  # Satır numarası arka planı
+    LINE_NUM_FG = "#565f89"  # Satır numarası rengi
+    
+    COLORS = {
+        # Anahtar kelimeler - Daha canlı renkler
+        TokenType.IF: "#7aa2f7",
+        TokenType.ELSE: "#7aa2f7",
+        TokenType.WHILE: "#7aa2f7",
+        TokenType.FOR: "#7aa2f7",
+        TokenType.RETURN: "#7aa2f7",
+        TokenType.TRUE: "#7aa2f7",
+        TokenType.FALSE: "#7aa2f7",
+        TokenType.PRINT: "#e0af68",
+
+        # Veri Tipleri
+        TokenType.INT: "#7dcfff",
+        TokenType.FLOAT: "#7dcfff",
+        TokenType.STRING_TYPE: "#7dcfff",
+        TokenType.BOOL: "#7dcfff",
+
+        # Tanımlayıcılar ve değişkenler
+        TokenType.IDENTIFIER: "#c0caf5",
+        TokenType.NUMBER: "#9ece6a",
+        TokenType.STRING_LITERAL: "#f7768e",
+
+        # Operatörler
+        TokenType.PLUS: "#bb9af7",
+        TokenType.MINUS: "#bb9af7",
+        TokenType.MULTIPLY: "#bb9af7",
+        TokenType.DIVIDE: "#bb9af7",
+        TokenType.ASSIGN: "#bb9af7",
+        TokenType.EQUALS: "#bb9af7",
+        TokenType.NOT_EQUALS: "#bb9af7",
+        TokenType.LESS_THAN: "#bb9af7",
+        TokenType.GREATER_THAN: "#bb9af7",
+        TokenType.LESS_EQUALS: "#bb9af7",
+        TokenType.GREATER_EQUALS: "#bb9af7",
+        TokenType.AND: "#bb9af7",
+        TokenType.OR: "#bb9af7",
+        TokenType.NOT: "#bb9af7",
+
+        # Ayraçlar
+        TokenType.LEFT_PAREN: "#c0caf5",
+        TokenType.RIGHT_PAREN: "#c0caf5",
+        TokenType.LEFT_BRACE: "#c0caf5",
+        TokenType.RIGHT_BRACE: "#c0caf5",
+        TokenType.LEFT_BRACKET: "#c0caf5",
+        TokenType.RIGHT_BRACKET: "#c0caf5",
+        TokenType.SEMICOLON: "#c0caf5",
+        TokenType.COMMA: "#c0caf5",
+
+        # Yorumlar
+        TokenType.COMMENT: "#565f89",
+        TokenType.MULTILINE_COMMENT: "#565f89",
+
+        # Bilinmeyen
+        TokenType.UNKNOWN: "#f7768e"
+    }
+
+    # Aynı renkteki token tipleri tek bir stil tag'ini paylaşır (ör. tüm operatörler)
+    STYLES = {"style_" + color.lstrip("#"): color for color in COLORS.values()}
+    STYLE_TAGS = {token_type: "style_" + color.lstrip("#") for token_type, color in COLORS.items()}
+    
+    ERROR_COLOR = "#f7768e"
+    ERROR_TAG = "error_tag"
+
+    OCCURRENCE_COLOR = "#3b4261"  # İmlecin altındaki sembolün diğer geçişleri
+    OCCURRENCE_TAG = "occurrence_tag"
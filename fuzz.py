@@ -0,0 +1,458 @@
+# fuzz.py
+# Alternatif lexer/parser motorlarını referans Lexer + Parser ile karşılaştıran
+# diferansiyel test düzeneği. Rastgele ve mutasyona uğramış programlar ile
+# rastgele düzenleme dizileri üretir; token akışlarını, AST'leri ve ParseError
+# konumlarını karşılaştırır, farkı tetikleyen girdiyi en küçük hâline indirger.
+import argparse
+import atexit
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.lexer import tokenize
+from core.parallel import check_parallel, tokenize_parallel
+from core.parser import Parser, ParseError
+from core.shm import SegmentPool, tokenize_shared
+
+
+@dataclass
+class Engine:
+    name: str
+    tokenize: Callable[[str], list]
+    parse: Callable[[list], object]
+    # İsteğe bağlı artımlı yol: (eski_kod, eski_tokenlar, düzenleme, yeni_kod) -> tokenlar
+    retokenize: Optional[Callable] = None
+
+
+def _reference_parse(tokens):
+    return Parser(tokens).parse()
+
+
+def _recovering_parse(tokens):
+    # Kurtarma modu hatasız girdide aynı AST'yi, hatalı girdide aynı ilk
+    # hatayı üretmeli (ve her girdide sonlanmalı)
+    parser = Parser(tokens, recover=True)
+    program = parser.parse()
+    if parser.errors:
+        raise parser.errors[0]
+    return program
+
+
+_SEGMENTS = SegmentPool()
+atexit.register(_SEGMENTS.close)
+
+
+def _shared_tokenize(code):
+    # Her çağrı bir nesildir: token'lar üretilir, segmentler havuza döner ve
+    # sonraki girdide yeniden kullanılır
+    with tokenize_shared(code, _SEGMENTS, max_workers=1, chunks=8) as tokens:
+        return list(tokens)
+
+
+def _checked_parse(tokens):
+    # Paralel denetim AST üretmez: hatası referansla karşılaştırılır, hatasız
+    # dediği girdide referans parse da hatasız olmalı
+    error = check_parallel(tokens, max_workers=1, min_tokens=0)
+    if error is not None:
+        raise error
+    try:
+        return Parser(tokens).parse()
+    except ParseError as missed:
+        raise AssertionError(f"check_parallel hatayı kaçırdı: {missed}") from None
+
+
+def _lazy_parse(tokens):
+    # Gövdeler kaynak sırasıyla açılır. Taslak geçişi bir hata bulursa önce
+    # ondan önceki gövdeler açılır; eager parse'ta onların hatası önce gelirdi.
+    parser = Parser(tokens, lazy_bodies=True)
+    try:
+        program = parser.parse()
+    except ParseError:
+        for body in parser.lazy_blocks:
+            body.materialize()
+        raise
+    for body in parser.lazy_blocks:
+        body.materialize()
+    return program
+
+
+def _lazy_recovering_parse(tokens):
+    # Kurtarma modunda gövdeler sonradan açıldığı için hatalar konum sırasıyla
+    # gelmez; hatasız girdide AST, hatalıda konuma göre ilk hata aynı olmalı
+    parser = Parser(tokens, recover=True, lazy_bodies=True)
+    program = parser.parse()
+    for body in parser.lazy_blocks:
+        body.materialize()
+    if parser.errors:
+        raise min(parser.errors, key=lambda error: error.token.start_pos)
+    return program
+
+
+REFERENCE = Engine("reference", tokenize, _reference_parse)
+
+# Aday motorlar buraya kaydedilir; "reference" kendisiyle karşılaştırılarak
+# düzeneğin deterministik olduğu doğrulanır.
+ENGINES: Dict[str, Engine] = {
+    "reference": REFERENCE,
+    # Süreç havuzu olmadan, en küçük eşikle: bölme ve hatayı yeniden üretme sınanır
+    "parallel-check": Engine("parallel-check", tokenize, _checked_parse),
+    "parallel-lexer": Engine(
+        "parallel-lexer",
+        lambda code: tokenize_parallel(code, max_workers=1, min_chars=0, chunks=8),
+        _reference_parse),
+    "recovering-parser": Engine("recovering-parser", tokenize, _recovering_parse),
+    "lazy-parser": Engine("lazy-parser", tokenize, _lazy_parse),
+    "lazy-recovering-parser": Engine("lazy-recovering-parser", tokenize, _lazy_recovering_parse),
+    "shared-lexer": Engine("shared-lexer", _shared_tokenize, _reference_parse),
+}
+
+
+def register_engine(engine):
+    ENGINES[engine.name] = engine
+    return engine
+
+
+# --- Gözlem ve karşılaştırma ---
+
+@dataclass
+class Observation:
+    tokens: Optional[List[tuple]] = None
+    ast: object = None
+    error: Optional[tuple] = None
+    crash: Optional[str] = None
+
+
+def _token_key(token):
+    return (token.type, token.value, token.start_pos, token.end_pos, token.line, token.column)
+
+
+def _error_key(error):
+    if error.token is None:
+        return (error.message, None)
+    return (error.message, _token_key(error.token))
+
+
+def observe(engine, code, tokens=None, timings=None):
+    """Motoru kod üzerinde çalıştırır; çıktıyı karşılaştırılabilir biçimde döndürür."""
+    observation = Observation()
+    started = time.perf_counter()
+    try:
+        if tokens is None:
+            tokens = engine.tokenize(code)
+        observation.tokens = [_token_key(t) for t in tokens]
+        try:
+            observation.ast = engine.parse(tokens)
+        except ParseError as error:
+            observation.error = _error_key(error)
+    except Exception as error:  # Aday motorların çökmesi de bir farktır
+        observation.crash = f"{type(error).__name__}: {error}"
+    if timings is not None:
+        timings[engine.name] = timings.get(engine.name, 0.0) + time.perf_counter() - started
+    return observation, tokens
+
+
+def difference(expected, actual):
+    """İki gözlem arasındaki ilk farkı açıklayan metni, fark yoksa None döndürür."""
+    if expected.crash or actual.crash:
+        if expected.crash != actual.crash:
+            return f"çökme: referans={expected.crash!r} aday={actual.crash!r}"
+        return None
+    if expected.tokens != actual.tokens:
+        for i, (a, b) in enumerate(zip(expected.tokens, actual.tokens)):
+            if a != b:
+                return f"token #{i}: referans={a} aday={b}"
+        return f"token sayısı: referans={len(expected.tokens)} aday={len(actual.tokens)}"
+    if expected.error != actual.error:
+        return f"ParseError: referans={expected.error} aday={actual.error}"
+    if expected.error is None and expected.ast != actual.ast:
+        return "AST farklı"
+    return None
+
+
+# --- Program üretimi ---
+
+_TYPES = ["int", "float", "string", "bool"]
+_NAMES = ["a", "b", "i", "x", "sayi", "toplam", "dizi", "int_count", "_t1", "ifx"]
+_BINARY = ["+", "-", "*", "/", "==", "!=", "<", ">", "<=", ">=", "&&", "||"]
+# Sınır durumlarını tetikleyen parçalar: kapanmayan yorumlar, satır sonuyla
+# bölünen stringler, sondaki kaçış karakterleri, yarım operatörler...
+_FRAGMENTS = [
+    "/*", "*/", "//", "\"", "'", "\\", "\n", "\r\n", "\t", " ", "{", "}", "(", ")",
+    "[", "]", ";", ",", ".", "1.", ".5", "3.14", "&", "|", "&&", "||", "!", "!=",
+    "=", "==", "<=", "@", "#", "ç", "ş", " ", "\"a\\\n", "'\\", "/*/", "**/",
+]
+
+
+class ProgramGenerator:
+    def __init__(self, rng, max_depth=3):
+        self.rng = rng
+        self.max_depth = max_depth
+
+    def program(self, size=8):
+        parts = [self.top_level(0) for _ in range(self.rng.randint(1, size))]
+        return "".join(parts)
+
+    def top_level(self, depth):
+        roll = self.rng.random()
+        if roll < 0.25:
+            return self.function()
+        if roll < 0.35:
+            return self.comment()
+        return self.statement(depth)
+
+    def comment(self):
+        if self.rng.random() < 0.5:
+            return "// " + self.word() + "\n"
+        return "/* " + self.word() + "\n " + self.word() + " */\n"
+
+    def word(self):
+        return self.rng.choice(["yorum", "not", "x = 1;", "\"s\"", "*", "/", "ğüşıöç"])
+
+    def function(self):
+        params = ", ".join(
+            f"{self.rng.choice(_TYPES)}{'[]' if self.rng.random() < 0.2 else ''} {self.rng.choice(_NAMES)}"
+            for _ in range(self.rng.randint(0, 3))
+        )
+        return_type = self.rng.choice(_TYPES) + ("[]" if self.rng.random() < 0.1 else "")
+        body = "".join(self.statement(1) for _ in range(self.rng.randint(0, 4)))
+        return f"{return_type} {self.rng.choice(_NAMES)}({params}) {{\n{body}}}\n"
+
+    def statement(self, depth):
+        kinds = ["decl", "expr", "print", "return"]
+        if depth < self.max_depth:
+            kinds += ["if", "while", "for", "block"]
+        kind = self.rng.choice(kinds)
+        pad = "    " * depth
+        if kind == "decl":
+            array = "[]" if self.rng.random() < 0.2 else ""
+            init = f" = {self.expression(0)}" if self.rng.random() < 0.7 else ""
+            return f"{pad}{self.rng.choice(_TYPES)}{array} {self.rng.choice(_NAMES)}{init};\n"
+        if kind == "expr":
+            return f"{pad}{self.target()} = {self.expression(0)};\n"
+        if kind == "print":
+            return f"{pad}print({self.expression(0)});\n"
+        if kind == "return":
+            value = self.expression(0) if self.rng.random() < 0.7 else ""
+            return f"{pad}return {value};\n"
+        if kind == "if":
+            text = f"{pad}if ({self.expression(0)}) {self.body(depth)}"
+            if self.rng.random() < 0.4:
+                text += f" else {self.body(depth)}"
+            return text + "\n"
+        if kind == "while":
+            return f"{pad}while ({self.expression(0)}) {self.body(depth)}\n"
+        if kind == "for":
+            name = self.rng.choice(_NAMES)
+            return (f"{pad}for (int {name} = 0; {name} < {self.expression(1)}; "
+                    f"{name} = {name} + 1) {self.body(depth)}\n")
+        return pad + self.body(depth) + "\n"
+
+    def body(self, depth):
+        inner = "".join(self.statement(depth + 1) for _ in range(self.rng.randint(0, 3)))
+        return "{\n" + inner + "    " * depth + "}"
+
+    def target(self):
+        name = self.rng.choice(_NAMES)
+        if self.rng.random() < 0.2:
+            return f"{name}[{self.expression(2)}]"
+        return name
+
+    def expression(self, depth):
+        roll = self.rng.random()
+        if depth >= 3 or roll < 0.3:
+            return self.atom()
+        if roll < 0.6:
+            return f"{self.expression(depth + 1)} {self.rng.choice(_BINARY)} {self.expression(depth + 1)}"
+        if roll < 0.7:
+            return f"{self.rng.choice(['!', '-'])}{self.expression(depth + 1)}"
+        if roll < 0.8:
+            return f"({self.expression(depth + 1)})"
+        if roll < 0.9:
+            args = ", ".join(self.expression(depth + 1) for _ in range(self.rng.randint(0, 2)))
+            return f"{self.rng.choice(_NAMES)}({args})"
+        return f"{self.rng.choice(_NAMES)}[{self.expression(depth + 1)}].length"
+
+    def atom(self):
+        return self.rng.choice([
+            str(self.rng.randint(0, 999)),
+            f"{self.rng.randint(0, 99)}.{self.rng.randint(0, 99)}",
+            "true", "false", "null",
+            "\"Merhaba\"", "'c'", "\"kaçış \\\" içeride\"",
+            self.rng.choice(_NAMES),
+        ])
+
+    def mutate(self, code, count=3):
+        """Koda rastgele silme, çoğaltma ve sınır parçası ekleme uygular."""
+        for _ in range(count):
+            offset, removed, inserted = self.edit(code)
+            code = code[:offset] + inserted + code[offset + removed:]
+        return code
+
+    def edit(self, code):
+        """Rastgele bir (konum, silinen_uzunluk, eklenen_metin) düzenlemesi üretir."""
+        offset = self.rng.randint(0, len(code))
+        roll = self.rng.random()
+        if roll < 0.3:
+            return offset, min(self.rng.randint(1, 8), len(code) - offset), ""
+        if roll < 0.45 and code:
+            start = self.rng.randint(0, len(code) - 1)
+            return offset, 0, code[start:start + self.rng.randint(1, 20)]
+        if roll < 0.55:
+            return offset, 0, self.statement(0)
+        return offset, self.rng.randint(0, 2) if offset < len(code) else 0, self.rng.choice(_FRAGMENTS)
+
+
+def apply_edit(code, edit):
+    offset, removed, inserted = edit
+    # Küçültme sırasında konumlar metnin dışına taşabilir, sınırlara çek
+    offset = min(offset, len(code))
+    removed = min(removed, len(code) - offset)
+    return code[:offset] + inserted + code[offset + removed:], (offset, removed, inserted)
+
+
+# --- Küçültme (delta debugging) ---
+
+def ddmin(items, failing):
+    """Zeller'in ddmin algoritması: `failing` doğru kaldığı sürece öğe atar."""
+    granularity = 2
+    while len(items) >= 2:
+        chunk = max(1, len(items) // granularity)
+        reduced = False
+        for start in range(0, len(items), chunk):
+            candidate = items[:start] + items[start + chunk:]
+            if candidate and failing(candidate):
+                items = candidate
+                granularity = max(granularity - 1, 2)
+                reduced = True
+                break
+        if not reduced:
+            if chunk == 1:
+                break
+            granularity = min(granularity * 2, len(items))
+    return items
+
+
+def shrink_code(code, failing):
+    """Önce satır, sonra karakter düzeyinde küçültür."""
+    lines = ddmin(code.splitlines(keepends=True), lambda ls: failing("".join(ls)))
+    chars = ddmin(list("".join(lines)), lambda cs: failing("".join(cs)))
+    return "".join(chars)
+
+
+# --- Çalıştırıcı ---
+
+@dataclass
+class Failure:
+    description: str
+    code: str
+    edits: List[Tuple[int, int, str]] = field(default_factory=list)
+
+    def __str__(self):
+        text = f"{self.description}\n  kod: {self.code!r}"
+        if self.edits:
+            text += f"\n  düzenlemeler: {self.edits!r}"
+        return text
+
+
+class DifferentialFuzzer:
+    def __init__(self, candidate, seed=0, max_size=8, reference=REFERENCE):
+        self.reference = reference
+        self.candidate = candidate
+        self.rng = random.Random(seed)
+        self.generator = ProgramGenerator(self.rng)
+        self.max_size = max_size
+        self.timings = {}
+        self.chars = 0
+
+    def check(self, code):
+        self.chars += len(code)
+        expected, _ = observe(self.reference, code, timings=self.timings)
+        actual, _ = observe(self.candidate, code, timings=self.timings)
+        return difference(expected, actual)
+
+    def check_edits(self, code, edits):
+        """Düzenlemeleri sırayla uygular; adayın artımlı yolunu her adımda sınar."""
+        _, tokens = observe(self.candidate, code)
+        for edit in edits:
+            new_code, edit = apply_edit(code, edit)
+            self.chars += len(new_code)
+            expected, _ = observe(self.reference, new_code, timings=self.timings)
+            incremental = None
+            if self.candidate.retokenize is not None and tokens is not None:
+                try:
+                    incremental = self.candidate.retokenize(code, tokens, edit, new_code)
+                except Exception as error:
+                    # Artımlı yolun çökmesi tam taramayla örtülmez, fark sayılır
+                    actual = Observation(crash=f"retokenize {type(error).__name__}: {error}")
+                    return difference(expected, actual)
+            actual, tokens = observe(self.candidate, new_code, tokens=incremental, timings=self.timings)
+            problem = difference(expected, actual)
+            if problem:
+                return problem
+            code = new_code
+        return None
+
+    def run(self, iterations, edit_steps=0):
+        for _ in range(iterations):
+            code = self.generator.program(self.rng.randint(1, self.max_size))
+            if self.rng.random() < 0.5:
+                code = self.generator.mutate(code, self.rng.randint(1, 4))
+            problem = self.check(code)
+            if problem:
+                return self.shrink(code, problem)
+            if edit_steps:
+                edits = []
+                current = code
+                for _ in range(edit_steps):
+                    edit = self.generator.edit(current)
+                    current, edit = apply_edit(current, edit)
+                    edits.append(edit)
+                problem = self.check_edits(code, edits)
+                if problem:
+                    return self.shrink_edits(code, edits, problem)
+        return None
+
+    def shrink(self, code, problem):
+        code = shrink_code(code, lambda c: self.check(c) is not None)
+        return Failure(self.check(code) or problem, code)
+
+    def shrink_edits(self, code, edits, problem):
+        edits = ddmin(edits, lambda es: self.check_edits(code, es) is not None)
+        code = shrink_code(code, lambda c: self.check_edits(c, edits) is not None)
+        # Sınırlara çekilmiş konumlarla raporla
+        current, clamped = code, []
+        for edit in edits:
+            current, edit = apply_edit(current, edit)
+            clamped.append(edit)
+        edits = clamped
+        return Failure(self.check_edits(code, edits) or problem, code, edits)
+
+    def report(self, out=sys.stdout):
+        for name, seconds in self.timings.items():
+            rate = self.chars / seconds / 1e6 if seconds else float("inf")
+            print(f"{name:>20}: {seconds:8.3f} sn, {rate:8.3f} M karakter/sn", file=out)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Lexer/Parser diferansiyel fuzz düzeneği")
+    arg_parser.add_argument("engine", nargs="?", default="reference", choices=sorted(ENGINES))
+    arg_parser.add_argument("-n", "--iterations", type=int, default=500)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--size", type=int, default=8, help="Üst düzey bildirim sayısı sınırı")
+    arg_parser.add_argument("--edits", type=int, default=5, help="Her program için düzenleme adımı")
+    args = arg_parser.parse_args(argv)
+
+    fuzzer = DifferentialFuzzer(ENGINES[args.engine], seed=args.seed, max_size=args.size)
+    failure = fuzzer.run(args.iterations, edit_steps=args.edits)
+    fuzzer.report()
+    if failure:
+        print(f"FARK BULUNDU:\n{failure}")
+        return 1
+    print(f"{args.iterations} girdi, fark yok.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,74 +1,41 @@
 # gui.py
+import re
+import time
 import tkinter as tk
+from bisect import bisect_left
 from tkinter import ttk
-from lexer import tokenize, TokenType
-from parser import Parser, ParseError
-
-class ModernTheme:
-    BG_COLOR = "#1a1b26"  # Daha koyu ve modern bir arka plan
-    TEXT_BG = "#24283b"   # Kod editörü arka planı
-    TEXT_FG = "#a9b1d6"   # Daha yumuşak bir metin rengi
-    LINE_NUM_BG = "#1a1b26"  # Satır numarası arka planı
-    LINE_NUM_FG = "#565f89"  # Satır numarası rengi
-    
-    COLORS = {
-        # Anahtar kelimeler - Daha canlı renkler
-        TokenType.IF: "#7aa2f7",
-        TokenType.ELSE: "#7aa2f7",
-        TokenType.WHILE: "#7aa2f7",
-        TokenType.FOR: "#7aa2f7",
-        TokenType.RETURN: "#7aa2f7",
-        TokenType.TRUE: "#7aa2f7",
-        TokenType.FALSE: "#7aa2f7",
-        TokenType.PRINT: "#e0af68",
-
-        # Veri Tipleri
-        TokenType.INT: "#7dcfff",
-        TokenType.FLOAT: "#7dcfff",
-        TokenType.STRING_TYPE: "#7dcfff",
-        TokenType.BOOL: "#7dcfff",
-
-        # Tanımlayıcılar ve değişkenler
-        TokenType.IDENTIFIER: "#c0caf5",
-        TokenType.NUMBER: "#9ece6a",
-        TokenType.STRING_LITERAL: "#f7768e",
-
-        # Operatörler
-        TokenType.PLUS: "#bb9af7",
-        TokenType.MINUS: "#bb9af7",
-        TokenType.MULTIPLY: "#bb9af7",
-        TokenType.DIVIDE: "#bb9af7",
-        TokenType.ASSIGN: "#bb9af7",
-        TokenType.EQUALS: "#bb9af7",
-        TokenType.NOT_EQUALS: "#bb9af7",
-        TokenType.LESS_THAN: "#bb9af7",
-        TokenType.GREATER_THAN: "#bb9af7",
-        TokenType.LESS_EQUALS: "#bb9af7",
-        TokenType.GREATER_EQUALS: "#bb9af7",
-        TokenType.AND: "#bb9af7",
-        TokenType.OR: "#bb9af7",
-        TokenType.NOT: "#bb9af7",
-
-        # Ayraçlar
-        TokenType.LEFT_PAREN: "#c0caf5",
-        TokenType.RIGHT_PAREN: "#c0caf5",
-        TokenType.LEFT_BRACE: "#c0caf5",
-        TokenType.RIGHT_BRACE: "#c0caf5",
-        TokenType.LEFT_BRACKET: "#c0caf5",
-        TokenType.RIGHT_BRACKET: "#c0caf5",
-        TokenType.SEMICOLON: "#c0caf5",
-        TokenType.COMMA: "#c0caf5",
-
-        # Yorumlar
-        TokenType.COMMENT: "#565f89",
-        TokenType.MULTILINE_COMMENT: "#565f89",
-
-        # Bilinmeyen
-        TokenType.UNKNOWN: "#f7768e"
+from core.document import Document
+from core.edits import EditDelta
+from core.lexer import tokenize
+from core.occurrences import OccurrenceIndex
+from core.parser import ResumableParse
+from core.theme import ModernTheme
+
+# Temel çok dilli düzlem (BMP) dışındaki karakterler, ör. emoji
+WIDE_CHAR = re.compile("[\U00010000-\U0010FFFF]")
+
+SAMPLE_CODE = """// Örnek kod
+int topla(int a, int b) {
+    return a + b;
+}
+
+float ortalama(int[] dizi) {
+    int toplam = 0;
+    for (int i = 0; i < dizi.length; i = i + 1) {
+        toplam = toplam + dizi[i];
     }
-    
-    ERROR_COLOR = "#f7768e"
-    ERROR_TAG = "error_tag"
+    return toplam / dizi.length;
+}
+
+/* Çok satırlı
+   yorum örneği */
+
+if (sayi > 0) {
+    print("Pozitif");
+} else {
+    print("Negatif");
+}
+"""
 
 class LineNumbers(tk.Text):
     def __init__(self, master, text_widget, **kwargs):
@@ -100,9 +67,158 @@ class LineNumbers(tk.Text):
             self.insert(tk.END, f"{linenum}\n")
             i = self.text_widget.index(f"{i}+1line")
 
+class TextProxy:
+    """Text widget'ının Tcl komutunu yeniden adlandırıp araya girer.
+
+    insert, delete ve replace çağrıları (geri al/yinele, yapıştırma ve
+    programatik düzenlemeler dâhil; Tk bunların hepsini widget komutu
+    üzerinden yapar) başarıyla uygulandıktan sonra dinleyicilere EditDelta
+    olarak bildirilir.
+    """
+
+    def __init__(self, widget, document):
+        self.tk = widget.tk
+        # Widget'ı yansıtan belge; konumlar Tk'de baştan saymadan, belgede
+        # O(log n) çevrilir (dinleyiciler belgeyi delta yayınlanınca günceller)
+        self.document = document
+        self.listeners = []
+        self.pending = []
+        # Tk 8.6 BMP dışı bir karakteri iki indeks karakteri (UTF-16 birimi)
+        # sayar, belge kod noktası sayar; Tk 9'da ikisi aynıdır
+        self.wide_chars = int(self.tk.call("string", "length", "\U0001F600")) == 2
+        self.original = widget._w + "_orig"
+        self.tk.call("rename", widget._w, self.original)
+        # Yeni widget komutu bir Tcl proc'udur: özgün komutun hataları (ör.
+        # seçim yokken "get sel.first sel.last") çağırana Tk'de olduğu gibi
+        # ulaşır; tk_textCopy gibi betikler bunları catch ile bekler. Python
+        # yalnızca düzenlemeden önce deltaları hesaplar ve düzenleme başarılı
+        # olursa yayınlar.
+        before = widget.register(self.before_edit)
+        after = widget.register(self.after_edit)
+        self.tk.call("proc", widget._w, "operation args", f"""
+            if {{$operation in {{insert delete replace}}}} {{
+                {before} $operation {{*}}$args
+                set result [{{{self.original}}} $operation {{*}}$args]
+                {after}
+                return $result
+            }}
+            return [{{{self.original}}} $operation {{*}}$args]
+        """)
+
+    def before_edit(self, operation, *args):
+        self.pending = []
+        if not self.editable():
+            return
+        try:
+            self.pending = getattr(self, "deltas_" + operation)(*args)
+        except tk.TclError:
+            pass  # Geçersiz indeks: özgün komut hatayı verir, düzenleme olmaz
+
+    def after_edit(self):
+        deltas, self.pending = self.pending, []
+        for delta in deltas:
+            for listener in self.listeners:
+                listener(delta)
+
+    def editable(self):
+        return str(self.tk.call(self.original, "cget", "-state")) != "disabled"
+
+    def position(self, index):
+        line, column = str(self.tk.call(self.original, "index", index)).split(".")
+        return int(line), int(column)
+
+    def offset(self, index):
+        line, column = self.position(index)
+        return self.document.offset(line, self.code_points(line, column) + 1)
+
+    def code_points(self, line, column):
+        """Satırdaki Tk sütununu, satır başından o noktaya kadarki kod noktası
+        sayısına çevirir."""
+        if not self.wide_chars or column == 0:
+            return column
+        start = self.document.line_start(line)
+        prefix = self.document.slice(start, start + column)
+        if not WIDE_CHAR.search(prefix):
+            return column
+        units = 0
+        for count, char in enumerate(prefix):
+            if units >= column:
+                return count
+            units += 2 if char > "\uffff" else 1
+        return len(prefix)
+
+    def is_line_start(self, index):
+        # Sütun 0'da ve ilk satırda değil
+        line, column = self.position(index)
+        return column == 0 and line != 1
+
+    def span(self, first, last=None):
+        # Tk'nin DeleteIndexRange kuralları: aralık "end"e uzanıyorsa son satır
+        # sonu korunur ve aralık bir satır başından başlıyorsa önceki satır
+        # sonu silinir (tüm satırları silme). Boş aralık, eklemenin yapılacağı
+        # konumu döndürür ("end"e ekleme son satır sonundan önce yapılır).
+        end = self.offset("end")
+        start = self.offset(first)
+        stop = min(start + 1 if last is None else self.offset(last), end)
+        if start >= stop:
+            start = min(start, end - 1)
+            return start, start
+        if stop == end:
+            stop -= 1
+            if self.is_line_start(first):
+                start -= 1
+        return start, stop
+
+    def deltas_insert(self, index, *chunks):
+        text = "".join(chunks[0::2])  # chars ?tagList chars tagList ...?
+        if not text:
+            return []
+        return [EditDelta(self.span(index, index)[0], 0, text)]
+
+    def deltas_delete(self, *indices):
+        # Tk aralıkları sıralar, çakışanları birleştirir ve sondan başa siler
+        spans = sorted(self.span(*indices[i:i + 2]) for i in range(0, len(indices), 2))
+        merged = []
+        for start, end in spans:
+            if end == start:
+                continue
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+            else:
+                merged.append((start, end))
+        return [EditDelta(start, end - start, "") for start, end in reversed(merged)]
+
+    def deltas_replace(self, first, last, *chunks):
+        # Tk önce siler, sonra ilk indeksin (satır, bayt) konumuna ekler; bu
+        # konum her durumda silinen aralığın başına denk gelir
+        start, end = self.span(first, last)
+        text = "".join(chunks[0::2])
+        if start == end and not text:
+            return []
+        return [EditDelta(start, end - start, text)]
+
+
 class SyntaxHighlighter:
-    def __init__(self, root):
+    # Ayrıştırma dilimi başına süre; arayüz bir kareden uzun bloklanmasın
+    PARSE_SLICE = 1 / 60
+
+    def __init__(self, root, code=None, timer=None):
         self.root = root
+        # timer: mark(etiket) metodu olan başlangıç zamanlayıcısı (main.py --timing)
+        self.timer = timer
+        self.first_highlight = True
+        self.parse_job = None
+        self.parse_after_id = None
+        # Son tamamlanan ayrıştırmanın parser'ı; fonksiyon gövdeleri görünür
+        # olunca açılır
+        self.outline = None
+        self.occurrences = OccurrenceIndex()
+        # Son renklendirilen metindeki BMP dışı karakterlerin konumları
+        self.wide_positions = []
+        # İndeksin token'larından bu yana yayınlanan düzenlemeler
+        self.pending_edits = []
+        self.highlight_after_id = None
+        self.awaiting_first_paint = True
         self.root.title("Syntax Highlighter")
         self.root.configure(bg=ModernTheme.BG_COLOR)
         
@@ -128,6 +244,12 @@ class SyntaxHighlighter:
             pady=5,
             highlightthickness=0
         )
+        # Tampon Text'ten her geçişte kopyalanmaz; yayınlanan değişikliklerle
+        # güncellenen bir parça tablosu ayna tutulur (boş Text de sonda bir
+        # satır sonu tutar)
+        self.document = Document("\n")
+        self.proxy = TextProxy(self.text, self.document)
+        self.proxy.listeners.append(self.on_edit)
         
         # Satır numaraları için frame
         self.line_numbers_frame = ttk.Frame(self.text_frame)
@@ -150,7 +272,7 @@ class SyntaxHighlighter:
         
         self.vsb = ttk.Scrollbar(self.text_frame, orient="vertical", command=self.text.yview)
         self.hsb = ttk.Scrollbar(self.text_frame, orient="horizontal", command=self.text.xview)
-        self.text.configure(yscrollcommand=self.vsb.set, xscrollcommand=self.hsb.set)
+        self.text.configure(yscrollcommand=self.on_yscroll, xscrollcommand=self.hsb.set)
         
         # Grid layout
         self.text.grid(row=0, column=1, sticky="nsew")
@@ -160,16 +282,19 @@ class SyntaxHighlighter:
         self.text_frame.grid_columnconfigure(1, weight=1)
         self.text_frame.grid_rowconfigure(0, weight=1)
         
-        # Renk stillerini ayarla
-        for token_type, color in ModernTheme.COLORS.items():
-            self.text.tag_configure(token_type.name, foreground=color)
+        # Renk stillerini ayarla (her farklı renk için tek tag)
+        for tag, color in ModernTheme.STYLES.items():
+            self.text.tag_configure(tag, foreground=color)
             
-        # Hata tag'ini ayarla
+        # Geçiş ve hata tag'lerini ayarla (hata arka planı üstte kalır)
+        self.text.tag_configure(ModernTheme.OCCURRENCE_TAG, background=ModernTheme.OCCURRENCE_COLOR)
         self.text.tag_configure(ModernTheme.ERROR_TAG, background=ModernTheme.ERROR_COLOR, underline=True)
         
         # Event binding
-        self.text.bind("<KeyRelease>", self.highlight)
-        self.text.bind("<<Paste>>", self.highlight)
+        self.text.bind("<KeyRelease>", self.mark_occurrences)
+        self.text.bind("<ButtonRelease-1>", self.mark_occurrences)
+        self.text.bind("<F3>", self.find_next)
+        self.text.bind("<Shift-F3>", lambda event: self.find_next(event, backwards=True))
         
         # Hata mesajı etiketi
         self.error_label = ttk.Label(
@@ -181,59 +306,181 @@ class SyntaxHighlighter:
         )
         self.error_label.pack(fill="x", pady=(5, 0))
         
-        # Başlangıç metni
-        self.text.insert("1.0", """// Örnek kod
-int topla(int a, int b) {
-    return a + b;
-}
+        # Başlangıç metni; ilk renklendirme pencere ilk kez çizildikten sonra
+        self.text.insert("1.0", SAMPLE_CODE if code is None else code)
+        self.first_expose = self.text.bind("<Expose>", self.on_first_expose, add="+")
 
-float ortalama(int[] dizi) {
-    int toplam = 0;
-    for (int i = 0; i < dizi.length; i = i + 1) {
-        toplam = toplam + dizi[i];
-    }
-    return toplam / dizi.length;
-}
+    def on_first_expose(self, event=None):
+        self.text.unbind("<Expose>", self.first_expose)
+        self.mark_time("ilk çizim")
+        self.awaiting_first_paint = False
+        self.schedule_highlight()
 
-/* Çok satırlı
-   yorum örneği */
+    def on_edit(self, delta):
+        self.document.apply(delta)
+        self.pending_edits.append(delta)
+        self.schedule_highlight()
 
-if (sayi > 0) {
-    print("Pozitif");
-} else {
-    print("Negatif");
-}
-""")
-        self.highlight()
+    def schedule_highlight(self):
+        # Aynı olay turundaki düzenlemeler tek renklendirmede birleşir
+        if self.highlight_after_id is None and not self.awaiting_first_paint:
+            self.highlight_after_id = self.root.after_idle(self.highlight)
+
+    def mark_time(self, label):
+        if self.timer is not None:
+            self.timer.mark(label)
 
     def highlight(self, event=None):
-        code = self.text.get("1.0", tk.END)
+        self.highlight_after_id = None
+        code = self.document.text()
+        # Tk sütunları UTF-16 birimi sayıyorsa token aralıkları bu konumlara göre düzeltilir
+        self.wide_positions = [m.start() for m in WIDE_CHAR.finditer(code)] if self.proxy.wide_chars else []
+        # Analiz güncel sürüme yetişti; eski sürümlerden konum taşımaya gerek yok
+        self.document.trim_log(self.document.version)
         
         # Tüm tag'leri temizle
-        for token_type in ModernTheme.COLORS.keys():
-            self.text.tag_remove(token_type.name, "1.0", tk.END)
+        for tag in ModernTheme.STYLES:
+            self.text.tag_remove(tag, "1.0", tk.END)
         self.text.tag_remove(ModernTheme.ERROR_TAG, "1.0", tk.END)
         self.error_label.config(text="")
 
         tokens = tokenize(code)
+        self.occurrences.update(tokens, self.pending_edits)
+        self.pending_edits = []
         
-        # Lexer renklendirmesi
+        # Lexer renklendirmesi: aralıkları stil başına topla, her stil için
+        # tek bir çok aralıklı "tag add" çağrısı yap
+        ranges = {tag: [] for tag in ModernTheme.STYLES}
         for token in tokens:
-            if token.type in ModernTheme.COLORS:
-                start_index = f"1.0+{token.start_pos}c"
-                end_index = f"1.0+{token.end_pos}c"
-                self.text.tag_add(token.type.name, start_index, end_index)
+            tag = ModernTheme.STYLE_TAGS.get(token.type)
+            if tag is not None:
+                ranges[tag].extend(self.token_range(token))
+        for tag, indices in ranges.items():
+            self.add_tag_ranges(tag, indices)
+        if self.first_highlight:
+            self.mark_time("ilk renklendirme")
+        self.mark_occurrences()
 
-        # Parser'ı çalıştır ve ParseError istisnasını yakala
-        parser = Parser(tokens)
-        try:
-            parser.parse()
-        except ParseError as e:
-            self.error_label.config(text=str(e))
+        # Parser'ı dilimler hâlinde, olay döngüsüne geri dönerek çalıştır.
+        # Önceki tamponun yarım kalan ayrıştırması bırakılır.
+        if self.parse_after_id is not None:
+            self.root.after_cancel(self.parse_after_id)
+        self.outline = None
+        self.parse_job = ResumableParse(tokens, recover=True, lazy_bodies=True)
+        self.parse_after_id = self.root.after_idle(self.continue_parse, self.parse_job)
+
+    def continue_parse(self, job):
+        self.parse_after_id = None
+        if job is not self.parse_job:
+            return  # Tampon bu arada değişti
+        if not job.run(self.PARSE_SLICE):
+            self.parse_after_id = self.root.after_idle(self.continue_parse, job)
+            return
+        self.parse_job = None
+        self.outline = job.parser
+        self.materialize_visible()
+        self.show_errors(job.parser.errors)
+        if self.first_highlight:
+            self.first_highlight = False
+            self.mark_time("ilk ayrıştırma")
+        # Görünmeyen gövdeler de boşta dilim dilim açılır ki hataları gösterilsin
+        self.parse_after_id = self.root.after_idle(self.materialize_rest, job.parser, 0)
+
+    def materialize_rest(self, outline, start):
+        self.parse_after_id = None
+        if outline is not self.outline:
+            return  # Tampon bu arada değişti
+        bodies = outline.lazy_blocks
+        deadline = time.perf_counter() + self.PARSE_SLICE
+        opened = False
+        while start < len(bodies) and time.perf_counter() < deadline:
+            if not bodies[start].parsed:
+                bodies[start].materialize()
+                opened = True
+            start += 1
+        if opened:
+            self.show_errors(outline.errors)
+        if start < len(bodies):
+            self.parse_after_id = self.root.after_idle(self.materialize_rest, outline, start)
+
+    def on_yscroll(self, first, last):
+        self.vsb.set(first, last)
+        if self.outline is not None and self.materialize_visible():
+            self.show_errors(self.outline.errors)
+
+    def materialize_visible(self):
+        """Görünür satırlarla kesişen fonksiyon gövdelerini ayrıştırır; yeni
+        gövde açıldıysa True döndürür. Diğerleri parantez dengesi denetiminden
+        geçmiştir; materialize_rest onları sonra boşta açar."""
+        top = int(self.text.index("@0,0").split(".")[0])
+        bottom = int(self.text.index(f"@0,{self.text.winfo_height()}").split(".")[0])
+        opened = False
+        for body in self.outline.lazy_blocks:
+            if not body.parsed and body.open_brace.line <= bottom and body.close_brace.line >= top:
+                body.materialize()
+                opened = True
+        return opened
+
+    def show_errors(self, errors):
+        # Tüm hatalı token'lar tek bir çağrıda işaretlenir; gövdeler sonradan
+        # açıldığı için ilk hata konuma göre seçilir
+        if not errors:
+            return
+        errors = sorted(errors, key=lambda e: (e.token.line, e.token.column) if e.token else (0, 0))
+        message = str(errors[0])
+        if len(errors) > 1:
+            message += f"  (+{len(errors) - 1} hata daha)"
+        self.error_label.config(text=message)
+        indices = []
+        for e in errors:
             if e.token:
-                start_index = f"1.0+{e.token.start_pos}c"
-                end_index = f"1.0+{e.token.end_pos}c"
-                self.text.tag_add(ModernTheme.ERROR_TAG, start_index, end_index)
+                indices.extend(self.token_range(e.token))
+        self.add_tag_ranges(ModernTheme.ERROR_TAG, indices)
+
+    def cursor_offset(self):
+        # Tk'nin baştan karakter saymasına gerek yok: satır.sütun belgede O(log n) çevrilir
+        return self.proxy.offset(tk.INSERT)
+
+    def symbol_under_cursor(self):
+        index = self.occurrences.token_at(self.cursor_offset())
+        return None if index is None else self.occurrences.tokens[index]
+
+    def mark_occurrences(self, event=None):
+        # İmlecin altındaki tanımlayıcı/anahtar kelimenin tüm geçişleri; yorum
+        # ve string içindeki aynı metin işaretlenmez
+        self.text.tag_remove(ModernTheme.OCCURRENCE_TAG, "1.0", tk.END)
+        symbol = self.symbol_under_cursor()
+        if symbol is None:
+            return
+        indices = []
+        for token in self.occurrences.occurrences(symbol.value):
+            indices.extend(self.token_range(token))
+        self.add_tag_ranges(ModernTheme.OCCURRENCE_TAG, indices)
+
+    def find_next(self, event=None, backwards=False):
+        symbol = self.symbol_under_cursor()
+        if symbol is not None:
+            target = self.occurrences.next_occurrence(symbol.value, symbol.start_pos, backwards)
+            self.text.mark_set(tk.INSERT, self.token_range(target)[0])
+            self.text.see(tk.INSERT)
+            self.mark_occurrences()
+        return "break"
+
+    def token_range(self, token):
+        # "satır.sütun" indeksi Tk tarafında "1.0+Nc" gibi baştan saymayı gerektirmez
+        column = token.column - 1
+        if self.wide_positions:
+            # Satırda token'dan önceki BMP dışı karakterler Tk sütununda ikişer
+            # sayılır ("+Nc" ise kod noktası sayar)
+            column += (bisect_left(self.wide_positions, token.start_pos)
+                       - bisect_left(self.wide_positions, token.start_pos - column))
+        start_index = f"{token.line}.{column}"
+        return start_index, f"{start_index}+{token.end_pos - token.start_pos}c"
+
+    def add_tag_ranges(self, tag, indices):
+        # Tk'nin "tag add tagName i1 i2 ?i1 i2 ...?" biçimi: tek Tcl çağrısında tüm aralıklar
+        if indices:
+            self.text.tk.call(self.text._w, "tag", "add", tag, *indices)
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -0,0 +1,103 @@
+# main.py
+# Giriş noktası. Çekirdek paket tkinter içermez; GUI ancak pencere açılacaksa
+# yüklenir. --timing ile içe aktarma ve başlangıç süreleri raporlanır.
+import time
+
+_STARTED = time.perf_counter()
+
+import argparse
+import sys
+
+
+class StartupTimer:
+    def __init__(self, enabled, started=_STARTED):
+        self.enabled = enabled
+        self.started = started
+        self.last = started
+
+    def mark(self, label):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        print(f"[zamanlama] {label:<22} +{(now - self.last) * 1000:8.1f} ms"
+              f"  (toplam {(now - self.started) * 1000:8.1f} ms)", file=sys.stderr)
+        self.last = now
+
+
+def read_source(path):
+    with open(path, encoding="utf-8") as source:
+        return source.read()
+
+
+def check(path, timer):
+    """Pencere açmadan dosyayı tarar ve ayrıştırır; hata varsa 1 döndürür."""
+    from core import Parser, tokenize
+    timer.mark("çekirdek import")
+    code = read_source(path)
+    tokens = tokenize(code)
+    timer.mark("lexer")
+    parser = Parser(tokens, recover=True)
+    parser.parse()
+    timer.mark("parser")
+    for error in parser.errors:
+        print(f"{path}: {error}")
+    return 1 if parser.errors else 0
+
+
+def run(path, timer):
+    """Dosyayı derleyip çalıştırır; sözdizimi veya çalışma hatasında 1 döndürür."""
+    from core import ParseError, Parser, tokenize
+    from core.executor import ExecutionError, compile_program
+    timer.mark("çekirdek import")
+    try:
+        program = Parser(tokenize(read_source(path))).parse()
+        timer.mark("lexer + parser")
+        compiled = compile_program(program)
+        timer.mark("derleme")
+        compiled.run()
+    except (ParseError, ExecutionError) as error:
+        print(f"{path}: {error}", file=sys.stderr)
+        return 1
+    finally:
+        timer.mark("çalıştırma")
+    return 0
+
+
+def run_gui(path, timer):
+    import gui  # tkinter yalnızca burada yüklenir
+    timer.mark("gui + tkinter import")
+    root = gui.tk.Tk()
+    root.geometry("1000x700")  # Daha büyük pencere
+    code = read_source(path) if path else None
+    gui.SyntaxHighlighter(root, code=code, timer=timer)
+    timer.mark("pencere kurulumu")
+    root.mainloop()
+    return 0
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Gerçek zamanlı sözdizimi renklendirici")
+    arg_parser.add_argument("file", nargs="?", help="Açılacak kaynak dosya (yoksa örnek kod)")
+    arg_parser.add_argument("--check", action="store_true",
+                            help="Pencere açmadan dosyayı denetle ve hataları yazdır")
+    arg_parser.add_argument("--run", action="store_true",
+                            help="Pencere açmadan dosyayı derle ve çalıştır")
+    arg_parser.add_argument("--timing", action="store_true",
+                            help="İçe aktarma ve başlangıç sürelerini stderr'e yaz")
+    args = arg_parser.parse_args(argv)
+
+    timer = StartupTimer(args.timing)
+    timer.mark("başlangıç")
+    if args.check:
+        if not args.file:
+            arg_parser.error("--check bir dosya gerektirir")
+        return check(args.file, timer)
+    if args.run:
+        if not args.file:
+            arg_parser.error("--run bir dosya gerektirir")
+        return run(args.file, timer)
+    return run_gui(args.file, timer)
+
+
+if __name__ == "__main__":
+    sys.exit(main())